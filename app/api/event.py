@@ -21,13 +21,14 @@ import json
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import Response
 
 from app.api.schema import EventSchema
 from app.database.event import Event
-from app.database.repository import GenericRepository
-from app.database.session import get_db_session
+from app.database.repository import AsyncGenericRepository
+from app.database.session import get_async_db_session
 from app.logging.factory import logger
 from app.worker.celery_app import celery_app
 
@@ -35,10 +36,10 @@ event_router = APIRouter()
 
 
 @event_router.post("/", dependencies=[])
-def handle_event(
+async def handle_event(
     data: EventSchema,
     request: Request,
-    session: Session = Depends(get_db_session),  # noqa: B008
+    session: AsyncSession = Depends(get_async_db_session),  # noqa: B008
 ) -> Response:
     """Handles incoming event submissions.
 
@@ -65,14 +66,15 @@ def handle_event(
 
     try:
         # Store event in database
-        repository = GenericRepository(session=session, model=Event)
+        repository = AsyncGenericRepository(session=session, model=Event)
         raw_event = data.model_dump(mode="json")
         event = Event(data=raw_event, workflow_type="calendar_pipeline")
-        repository.create(obj=event)
+        await repository.create(obj=event)
         logger.info("Event stored in database")
 
-        # Queue processing task with correlation_id
-        task_id = celery_app.send_task(
+        # Queue processing task with correlation_id (blocking broker publish, off the loop)
+        task_id = await run_in_threadpool(
+            celery_app.send_task,
             "process_incoming_event",
             args=[str(event.id)],  # Converts UUID to string
             kwargs={"correlation_id": request.state.correlation_id},
@@ -14,9 +14,9 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.session import get_db_session
+from app.database.session import get_async_db_session
 
 health_router = APIRouter()
 
@@ -76,10 +76,10 @@ def _get_flower_url():
     return worker_config.flower_url
 
 
-def _check_database(db: Session) -> dict[str, str]:
+async def _check_database(db: AsyncSession) -> dict[str, str]:
     """Check database connectivity."""
     try:
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
         return {"status": "healthy", "message": "Database connection successful"}
     except Exception as e:
         return {"status": "unhealthy", "message": f"Database connection failed: {str(e)}"}
@@ -152,7 +152,7 @@ async def basic_health() -> dict[str, Any]:
 @health_router.get("/ready")
 async def readiness_check(
     check_flower: bool = Query(False, description="Include Flower monitoring service check"),
-    db: Session = Depends(get_db_session),  # noqa: B008
+    db: AsyncSession = Depends(get_async_db_session),  # noqa: B008
 ) -> dict[str, Any]:
     """
     Comprehensive readiness check for all critical services.
@@ -165,7 +165,7 @@ async def readiness_check(
         "service": "llm-calendar-assistant-api",
         "timestamp": datetime.now(UTC).isoformat(),
         "components": {
-            "database": _check_database(db),
+            "database": await _check_database(db),
             "redis": _check_redis(),
             "celery": _check_celery(),
         },
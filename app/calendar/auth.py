@@ -6,6 +6,8 @@ dependency injection, and separation of concerns.
 """
 
 import os
+import threading
+from functools import lru_cache
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -45,7 +47,8 @@ class GoogleAuthClient:
         self._token_path = self._config.token_path
         self._creds_path = self._config.credentials_path
         self._credentials: Credentials | None = None
-        self._service: Resource | None = None
+        self._local = threading.local()  # Per-thread service objects
+        self._lock = threading.Lock()
 
     def _save_credentials(self, creds: Credentials) -> None:
         """
@@ -160,20 +163,63 @@ class GoogleAuthClient:
         Raises:
             AuthenticationError: If authentication fails
         """
-        # Return cached service if still valid
-        if self._service and self._credentials and self._credentials.valid:
-            return self._service
+        # Serialized so that a background prewarm and a pipeline run never refresh at once
+        with self._lock:
+            return self._authenticate(api_name, api_version)
 
-        # Get fresh credentials
+    def _authenticate(self, api_name: str, api_version: str) -> Resource:
+        """Authenticate and build the service; callers must hold self._lock
+
+        Credentials are shared by all threads, but each thread gets its own service object:
+        the underlying httplib2 connection is not thread-safe, and executors run in worker
+        threads of the shared pipeline loop.
+        """
+        # Get fresh credentials unless the shared ones are still valid
+        if not self._credentials or not self._credentials.valid:
+            self._credentials = self._obtain_credentials()
+
+        # Return this thread's cached service if it was built with the current credentials
+        local = self._local
+        api = (api_name, api_version)
+        if getattr(local, "credentials", None) is self._credentials and local.api == api:
+            return local.service
+
+        # Build service object for this thread
+        try:
+            service = build(
+                api_name, api_version, credentials=self._credentials, cache_discovery=False
+            )
+            if not service:
+                raise AuthenticationError(f"Failed to build {api_name} service: service is None")
+            logger.debug("Built %s service (v%s)", api_name, api_version)
+
+        except Exception as e:
+            logger.error("Failed to build %s service: %s", api_name, e)
+            raise AuthenticationError(f"Failed to build {api_name} service: {e}") from e
+
+        local.service = service
+        local.api = api
+        local.credentials = self._credentials
+        return service
+
+    def _obtain_credentials(self, interactive: bool = True) -> Credentials:
+        """Load, refresh or newly authorize credentials; callers must hold self._lock
+
+        With interactive=False, only stored credentials are loaded or refreshed; the OAuth
+        flow is never started and AuthenticationError is raised instead.
+        """
         try:
-            self._credentials = self._load_existing_credentials()
+            credentials = self._load_existing_credentials()
 
             # If credentials exist but are expired, try to refresh
-            if self._credentials and self._credentials.expired:
-                self._credentials = self._refresh_credentials(self._credentials)
+            if credentials and credentials.expired:
+                credentials = self._refresh_credentials(credentials)
 
             # If no valid credentials, run OAuth flow
-            if not self._credentials or not self._credentials.valid:
+            if not credentials or not credentials.valid:
+                if not interactive:
+                    raise AuthenticationError("No valid stored credentials")
+
                 # Provide better error message for Docker environment
                 if _is_docker_environment():
                     logger.error("No valid credentials in Docker environment")
@@ -184,24 +230,28 @@ class GoogleAuthClient:
                     )
 
                 logger.info("Starting OAuth flow for new credentials")
-                self._credentials = self._run_oauth_flow()
+                credentials = self._run_oauth_flow()
 
         except Exception as e:
             raise AuthenticationError(f"Failed to obtain valid credentials: {e}") from e
 
-        # Build service object
-        try:
-            self._service = build(
-                api_name, api_version, credentials=self._credentials, cache_discovery=False
-            )
-            if not self._service:
-                raise AuthenticationError(f"Failed to build {api_name} service: service is None")
-            logger.debug("Built %s service (v%s)", api_name, api_version)
-            return self._service
+        return credentials
+
+    def prewarm(self) -> None:
+        """
+        Authenticate ahead of the calendar operations, ignoring failures.
 
+        Loads or refreshes the stored credentials shared by all threads, so that a later
+        authenticate() only has to build its thread's service. Never starts the interactive
+        OAuth flow, which would block with the lock held; that only starts from an actual
+        calendar operation. Failures are left for that operation to report.
+        """
+        try:
+            with self._lock:
+                if not self._credentials or not self._credentials.valid:
+                    self._credentials = self._obtain_credentials(interactive=False)
         except Exception as e:
-            logger.error("Failed to build %s service: %s", api_name, e)
-            raise AuthenticationError(f"Failed to build {api_name} service: {e}") from e
+            logger.debug("Skipped authentication prewarm: %s", e)
 
     def revoke_credentials(self) -> None:
         """
@@ -210,27 +260,42 @@ class GoogleAuthClient:
         Raises:
             AuthenticationError: If revocation fails
         """
-        if self._credentials:
-            try:
-                self._credentials.revoke(Request())
-                logger.debug("Credentials revoked")
-            except Exception as e:
-                logger.warning("Failed to revoke credentials: %s", e)
-
-        # Clear token file (safer for Docker environments than deletion)
-        if self._token_path.exists():
-            try:
-                # Atomically write empty content to clear the file
-                temp_path = self._token_path.with_suffix(".tmp")
-                temp_path.write_text("", encoding="utf-8")
-                temp_path.replace(self._token_path)
-                logger.debug("Token file cleared: %s", self._token_path)
-            except Exception as e:
-                raise AuthenticationError(f"Failed to clear token file: {e}") from e
-
-        # Clear cached objects AFTER the file is cleared
-        self._credentials = None
-        self._service = None
+        # Serialized so that no thread reloads the token between clearing it and the cache
+        with self._lock:
+            if self._credentials:
+                try:
+                    self._credentials.revoke(Request())
+                    logger.debug("Credentials revoked")
+                except Exception as e:
+                    logger.warning("Failed to revoke credentials: %s", e)
+
+            # Clear token file (safer for Docker environments than deletion)
+            if self._token_path.exists():
+                try:
+                    # Atomically write empty content to clear the file
+                    temp_path = self._token_path.with_suffix(".tmp")
+                    temp_path.write_text("", encoding="utf-8")
+                    temp_path.replace(self._token_path)
+                    logger.debug("Token file cleared: %s", self._token_path)
+                except Exception as e:
+                    raise AuthenticationError(f"Failed to clear token file: {e}") from e
+
+            # Clear cached objects AFTER the file is cleared, still under the lock
+            self._credentials = None
+            self._local = threading.local()
+
+
+@lru_cache
+def get_google_auth_client() -> GoogleAuthClient:
+    """
+    Get the process-wide Google auth client. Uses lru_cache so that loaded credentials
+    and each thread's service object are reused across pipeline runs until the token
+    expires.
+
+    Returns:
+        GoogleAuthClient: The shared auth client.
+    """
+    return GoogleAuthClient()
 
 
 def _is_docker_environment() -> bool:
@@ -103,6 +103,28 @@ class GoogleLookupEventResponse(BaseModel):
     )
 
 
+def event_response_from_api(event: dict) -> GoogleEventResponse:
+    """
+    Convert a Google Calendar API event resource to GoogleEventResponse.
+
+    The resource comes straight from the API, so the model and its nested models are
+    built without validation. Google omits summary for untitled events.
+    """
+    attendees = event.get("attendees")
+    return GoogleEventResponse.model_construct(
+        id=event["id"],
+        summary=event.get("summary", ""),
+        description=event.get("description"),
+        start=GoogleDateTime.model_construct(**event["start"]),
+        end=GoogleDateTime.model_construct(**event["end"]),
+        location=event.get("location"),
+        attendees=[GoogleAttendee.model_construct(**att) for att in attendees]
+        if attendees
+        else None,
+        htmlLink=event["htmlLink"],
+    )
+
+
 def create_event_model_to_request(
     model: CreateResponse,
 ) -> GoogleCreateEventRequest:
@@ -4,6 +4,9 @@ Google Calendar Service Module
 Handles calendar operations using the Google Calendar API.
 """
 
+import logging
+from functools import lru_cache
+from http import HTTPStatus
 from typing import Any
 
 from googleapiclient.discovery import Resource
@@ -12,6 +15,27 @@ from googleapiclient.errors import HttpError
 from app.calendar.schema import GoogleEventResponse
 from app.logging.factory import logger
 
+# Calendar API recommends at most 50 calls per batch request
+BATCH_MAX_REQUESTS = 50
+
+
+@lru_cache(maxsize=32)
+def _events_collection(service: Resource) -> Resource:
+    """
+    Get the events collection of a service, built once per service object.
+
+    Each service.events() call rebuilds the collection from the discovery document
+    (~2ms). The auth client caches one service per thread, so the cache holds one
+    collection per worker thread (up to the default executor's 32 threads).
+
+    Args:
+        service: Authenticated googleapiclient.discovery.Resource object
+
+    Returns:
+        Events collection resource
+    """
+    return service.events()  # type: ignore
+
 
 class GoogleCalendarService:
     """Performs Google Calendar API operations using an authenticated service."""
@@ -28,6 +52,7 @@ class GoogleCalendarService:
         if not service:
             raise ValueError("Authenticated service object is required")
         self.service = service
+        self.events = _events_collection(service)
         logger.info("Initialized Google Calendar service")
 
     def create_event(self, calendar_id: str, event_body: dict) -> dict:
@@ -49,9 +74,9 @@ class GoogleCalendarService:
             raise ValueError("Calendar ID and event body are required")
 
         try:
-            created_event = (
-                self.service.events().insert(calendarId=calendar_id, body=event_body).execute()  # type: ignore
-            )
+            created_event = self.events.insert(  # type: ignore
+                calendarId=calendar_id, body=event_body
+            ).execute()
 
             logger.debug(
                 "Created event: id=%s, summary='%s', link=%s",
@@ -87,7 +112,7 @@ class GoogleCalendarService:
             raise ValueError("Calendar ID and Event object are required")
 
         try:
-            self.service.events().delete(
+            self.events.delete(
                 calendarId=calendar_id,
                 eventId=event.id,
                 **query_params,
@@ -101,7 +126,7 @@ class GoogleCalendarService:
             )
 
         except HttpError as error:
-            if error.resp.status == 404:
+            if error.resp.status == HTTPStatus.NOT_FOUND:
                 logger.warning("Event %s not found (already deleted?)", event.id)
                 return
             logger.error("API error deleting event: %s", error)
@@ -110,6 +135,92 @@ class GoogleCalendarService:
             logger.error("Unexpected error deleting event: %s", e)
             raise
 
+    def batch_delete_events(
+        self, calendar_id: str, events: list[GoogleEventResponse], **query_params: Any
+    ) -> list[GoogleEventResponse]:
+        """
+        Delete multiple calendar events with batch requests (one round-trip per 50 events).
+
+        Args:
+            calendar_id: Calendar ID containing the events
+            events: Event objects with id, summary, htmlLink properties
+            **query_params: Optional query parameters (sendUpdates, etc.)
+
+        Returns:
+            Deleted events (including events that were already deleted)
+
+        Raises:
+            ValueError: If calendar ID is missing
+            HttpError: If any delete operation fails, after the whole batch has run; the
+                events deleted before the error are logged, since the caller never
+                receives them
+        """
+        if not calendar_id:
+            raise ValueError("Calendar ID is required")
+
+        if len(events) == 1:
+            self.delete_event(calendar_id=calendar_id, event=events[0], **query_params)
+            return list(events)
+
+        deleted: list[GoogleEventResponse] = []
+        errors: list[Exception] = []
+
+        def on_response(request_id: str, _response: Any, exception: Exception | None) -> None:
+            event = events[int(request_id)]
+            if exception is None:
+                deleted.append(event)
+                logger.debug(
+                    "Deleted event: id=%s, summary='%s', link=%s",
+                    event.id,
+                    event.summary,
+                    event.htmlLink,
+                )
+            elif isinstance(exception, HttpError) and exception.resp.status == HTTPStatus.NOT_FOUND:
+                logger.warning("Event %s not found (already deleted?)", event.id)
+                deleted.append(event)
+            else:
+                logger.error("API error deleting event %s: %s", event.id, exception)
+                errors.append(exception)
+
+        event_ids = [event.id for event in events]
+
+        try:
+            for start in range(0, len(event_ids), BATCH_MAX_REQUESTS):
+                batch = self.service.new_batch_http_request(callback=on_response)  # type: ignore
+                for index, event_id in enumerate(
+                    event_ids[start : start + BATCH_MAX_REQUESTS], start=start
+                ):
+                    batch.add(
+                        self.events.delete(
+                            calendarId=calendar_id, eventId=event_id, **query_params
+                        ),
+                        request_id=str(index),
+                    )
+                batch.execute()
+        except HttpError as error:
+            logger.error("API error executing delete batch: %s", error)
+            self._log_partial_deletion(deleted, len(events))
+            raise
+        except Exception as e:
+            logger.error("Unexpected error deleting events: %s", e)
+            self._log_partial_deletion(deleted, len(events))
+            raise
+
+        if errors:
+            self._log_partial_deletion(deleted, len(events))
+            raise errors[0]
+        return deleted
+
+    @staticmethod
+    def _log_partial_deletion(deleted: list[GoogleEventResponse], total: int) -> None:
+        """Log the events deleted before a batch failed; the raised error does not carry them"""
+        logger.error(
+            "Deleted %d of %d events before the failure: %s",
+            len(deleted),
+            total,
+            ", ".join(event.id for event in deleted) or "none",
+        )
+
     def list_events(
         self,
         calendar_id: str | None = None,
@@ -123,31 +234,28 @@ class GoogleCalendarService:
             **query_params: Query parameters (from GoogleLookupEventRequest.model_dump())
 
         Returns:
-            List of event resources
+            List of event resources (never contains empty entries)
 
         Raises:
             HttpError: If the API call fails
         """
         try:
-            events_result = (
-                self.service.events()  # type: ignore
-                .list(
-                    calendarId=calendar_id,
-                    **query_params,
-                )
-                .execute()
-            )
+            events_result = self.events.list(  # type: ignore
+                calendarId=calendar_id,
+                **query_params,
+            ).execute()
 
             events = events_result.get("items", [])
 
             # Log individual events with standardized format
-            for event in events:
-                logger.debug(
-                    "Listed event: id=%s, summary='%s', link=%s",
-                    event.get("id"),
-                    event.get("summary"),
-                    event.get("htmlLink"),
-                )
+            if logger.isEnabledFor(logging.DEBUG):
+                for event in events:
+                    logger.debug(
+                        "Listed event: id=%s, summary='%s', link=%s",
+                        event.get("id"),
+                        event.get("summary"),
+                        event.get("htmlLink"),
+                    )
 
             return events
 
@@ -178,7 +286,7 @@ class GoogleCalendarService:
 
         try:
             event = (
-                self.service.events().get(calendarId=calendar_id, eventId=event_id).execute()  # type: ignore
+                self.events.get(calendarId=calendar_id, eventId=event_id).execute()  # type: ignore
             )
 
             logger.debug(
@@ -6,6 +6,7 @@ It implements the Chain of Responsibility pattern, allowing nodes to process tas
 sequentially and pass results to the next node in the chain.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from app.core.schema.task import TaskContext
@@ -57,3 +58,18 @@ class Node(ABC):
             2. Store results using task_context.update_node(self.node_name, **results)
         """
         pass
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        """Processes the task context without blocking the event loop.
+
+        The pipeline awaits this method. The default runs the synchronous process()
+        in a worker thread; nodes doing async I/O (LLM calls) override it with a
+        native implementation and keep process() as a sync entry point.
+
+        Args:
+            task_context: The shared context object passed through the pipeline
+
+        Returns:
+            Updated TaskContext with this node's processing results
+        """
+        return await asyncio.to_thread(self.process, task_context)
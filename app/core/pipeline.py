@@ -6,8 +6,12 @@ It provides a flexible way to execute a series of nodes in sequence,
 with support for routing logic, logging, and error handling.
 """
 
+import asyncio
+import os
+import threading
 from abc import ABC
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import ClassVar
 
 from app.api.schema import EventSchema
@@ -19,6 +23,71 @@ from app.logging.config import PIPELINE, WORKER
 from app.logging.factory import logger, set_service_tag
 
 
+@lru_cache(maxsize=1)
+def get_pipeline_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide event loop that runs pipelines, started on first use.
+
+    The loop lives in a daemon thread for the lifetime of the process, so async LLM
+    clients (cached per loop) keep their connection pool and TLS sessions across
+    pipeline runs instead of reconnecting on every asyncio.run().
+
+    Returns:
+        asyncio.AbstractEventLoop: The running shared event loop.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="pipeline-loop", daemon=True).start()
+    return loop
+
+
+# The loop thread does not survive fork (Celery prefork); children start their own
+os.register_at_fork(after_in_child=get_pipeline_loop.cache_clear)
+
+
+class ParallelNodeGroup(Node):
+    """Runs independent nodes concurrently as a single pipeline step.
+
+    Member nodes must not depend on each other's results; each one reads the shared
+    task context and stores its own result under its node name. Members are awaited in
+    declaration order, so the first member's error takes precedence, and any member that
+    is still in flight when another fails is cancelled.
+
+    Attributes:
+        nodes: List of Node classes to run concurrently
+    """
+
+    def __init__(self):
+        self.nodes: list[type[Node]] = []  # Node classes
+
+    def process(self, task_context: TaskContext) -> TaskContext:
+        """Processes all member nodes (sync entry point)"""
+        return asyncio.run(self.aprocess(task_context))
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        """Processes all member nodes concurrently and waits for every one to finish.
+
+        Args:
+            task_context: The shared context object passed through the pipeline
+
+        Returns:
+            Updated TaskContext with the results of all member nodes
+
+        Raises:
+            Exception: The first failing member's exception, in declaration order
+        """
+        tasks = [asyncio.create_task(node().aprocess(task_context)) for node in self.nodes]
+        try:
+            for task in tasks:
+                await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Retrieve outstanding results so cancelled or failed tasks are not reported
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return task_context
+
+
 class Pipeline(ABC):
     """Abstract base class for defining processing pipelines.
 
@@ -63,17 +132,40 @@ class Pipeline(ABC):
         Raises:
             Exception: Re-raises any exception that occurs during node execution
         """
-        logger.info(f"Starting node: {node_name}")
+        logger.info("Starting node: %s", node_name)
         try:
             yield
         except Exception as e:
-            logger.error(f"Error in node {node_name}: {str(e)}")
+            logger.error("Error in node %s: %s", node_name, e)
             raise
         finally:
-            logger.info(f"Completed node: {node_name}")
+            logger.info("Completed node: %s", node_name)
 
     def run(self, event: EventSchema) -> TaskContext:
-        """Executes the pipeline for a given event.
+        """Executes the pipeline for a given event (sync entry point).
+
+        Runs arun() on the process-wide pipeline loop, so async nodes share it (and
+        its per-loop LLM clients) within and across pipeline runs. Context variables
+        such as the request ID are carried over from the calling thread.
+
+        Args:
+            event: The event to process through the pipeline
+
+        Returns:
+            TaskContext containing the results of pipeline execution
+
+        Raises:
+            Exception: Any exception that occurs during pipeline execution
+        """
+        future = asyncio.run_coroutine_threadsafe(self.arun(event), get_pipeline_loop())
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()  # e.g. a task time limit interrupted the wait
+            raise
+
+    async def arun(self, event: EventSchema) -> TaskContext:
+        """Executes the pipeline for a given event without blocking the event loop.
 
         Args:
             event: The event to process through the pipeline
@@ -96,7 +188,7 @@ class Pipeline(ABC):
             node_config = self.nodes[current_node_class]
             current_node = node_config.node()  # Instantiate the node
             with self.node_context(current_node_class.__name__):
-                task_context = current_node.process(task_context)
+                task_context = await current_node.aprocess(task_context)
 
             current_node_class = self._get_next_node_class(current_node_class, task_context)
 
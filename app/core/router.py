@@ -58,6 +58,10 @@ class Router(Node):
         )
         return task_context
 
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        """Routing is CPU-only, so it runs inline on the event loop"""
+        return self.process(task_context)
+
     def route(self, task_context: TaskContext) -> type[Node] | None:
         """Determines the next node based on routing rules.
 
@@ -8,11 +8,19 @@ These models are independent of specific operations (create, delete, etc).
 
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Self
+from typing import Any, Self
 from zoneinfo import ZoneInfo, available_timezones
 
 from dateutil.parser import isoparse
-from pydantic import BaseModel, EmailStr, Field, computed_field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 
 
 class EventType(str, Enum):
@@ -27,6 +35,8 @@ class EventType(str, Enum):
 class AllDayEventDate(BaseModel):
     """Model for all-day event dates"""
 
+    model_config = ConfigDict(frozen=True)
+
     date: str = Field(description="All-day event date in YYYY-MM-DD format")
 
     @field_validator("date")
@@ -43,9 +53,31 @@ class AllDayEventDate(BaseModel):
 class EventDateTime(BaseModel):
     """Event time specification with comprehensive validation"""
 
-    dateTime: str = Field(description="RFC3339 timestamp with timezone offset")
+    model_config = ConfigDict(frozen=True)
+
+    dateTime: str = Field(
+        description="RFC3339 timestamp; a local time without offset is resolved in timeZone"
+    )
     timeZone: str = Field(description="IANA timezone")
 
+    @model_validator(mode="before")
+    @classmethod
+    def localize_naive_datetime(cls, data: Any) -> Any:
+        """Attach the timeZone's UTC offset to a local dateTime given without one"""
+        if not isinstance(data, dict):
+            return data
+        value, timezone = data.get("dateTime"), data.get("timeZone")
+        if not isinstance(value, str) or not isinstance(timezone, str):
+            return data
+        try:
+            dt = isoparse(value)
+            if dt.tzinfo is not None:
+                return data
+            localized = dt.replace(tzinfo=ZoneInfo(timezone)).isoformat(timespec="seconds")
+        except Exception:
+            return data  # Invalid values are reported by the field validators
+        return {**data, "dateTime": localized}
+
     @field_validator("dateTime")
     @classmethod
     def validate_datetime(cls, v: str) -> str:
@@ -104,6 +136,8 @@ class EventDateTime(BaseModel):
 class EventTimeWindow(BaseModel):
     """Time window for event search"""
 
+    model_config = ConfigDict(frozen=True)
+
     center: EventDateTime = Field(description="Center of the time window")
     buffer_minutes: int = Field(default=5, description="Buffer time in minutes")
     original_reference: str = Field(description="Original reference for the time window")
@@ -158,18 +192,22 @@ class EventLookup(BaseModel):
 class Attendee(BaseModel):
     """Event attendee"""
 
+    model_config = ConfigDict(frozen=True)
+
     email: EmailStr = Field(description="Email address")
 
 
 class EventFields(BaseModel):
     """Common event fields"""
 
+    model_config = ConfigDict(frozen=True)
+
     summary: str | None = Field(description="Event title/summary")
     start: EventDateTime | AllDayEventDate | None = Field(description="Event start time or date")
     end: EventDateTime | AllDayEventDate | None = Field(description="Event end time or date")
     description: str | None = Field(description="Short statement of key topics/tasks")
     location: str | None = Field(description="Location of the event")
-    attendees: list[Attendee] = Field(default_factory=list, description="List of attendees")
+    attendees: tuple[Attendee, ...] = Field(default_factory=tuple, description="List of attendees")
 
     @field_validator("summary", "description", "location", mode="before")
     @classmethod
@@ -6,6 +6,7 @@ It provides type-safe structures for tracking pipeline state, intermediate resul
 throughout execution.
 """
 
+from dataclasses import dataclass, replace
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -13,6 +14,24 @@ from pydantic import BaseModel, Field
 from app.api.schema import EventSchema
 
 
+@dataclass(slots=True, frozen=True)
+class NodeResult:
+    """Result of a single node's execution.
+
+    Every node stores the same small set of fields, so a slotted dataclass replaces
+    the per-node dictionary: smaller instances, faster construction and attribute access.
+
+    Attributes:
+        response_model: Validated output of the node (LLM response or API result)
+        usage: Token usage of the LLM call, if any
+        next_node: Name of the next node chosen by a router
+    """
+
+    response_model: Any = None
+    usage: Any = None
+    next_node: str | None = None
+
+
 class TaskContext(BaseModel):
     """Context container for calendar request processing.
 
@@ -22,24 +41,24 @@ class TaskContext(BaseModel):
 
     Attributes:
         event: The original event that triggered the pipeline
-        nodes: Dictionary storing results and state from each node's execution
+        nodes: Dictionary storing each node's NodeResult
         metadata: Dictionary storing pipeline-level metadata and configuration
 
     Example:
         task_context = TaskContext(
             event=incoming_event,
             nodes={
-                "ValidateEvent": {
-                    "response_model": response_model,
-                    "usage": completion.usage
-                }
+                "ValidateEvent": NodeResult(
+                    response_model=response_model,
+                    usage=completion.usage,
+                )
             },
             metadata={}
         )
     """
 
     event: EventSchema
-    nodes: dict[str, Any] = Field(
+    nodes: dict[str, NodeResult] = Field(
         default_factory=dict,
         description="Results and status from each node's execution",
     )
@@ -48,28 +67,21 @@ class TaskContext(BaseModel):
     )
 
     def update_node(self, node_name: str, **kwargs: Any) -> None:
-        """Update node data with new key-value pairs using safe dictionary merging.
+        """Update node data with new field values, keeping existing ones.
 
         This method provides a clean interface for updating node execution results
-        while preserving existing data. It safely merges new data with existing
-        node data, creating the node entry if it doesn't exist.
+        while preserving existing data. It creates the node's NodeResult if it doesn't
+        exist, otherwise replaces it with a copy carrying the new values.
 
         Args:
             node_name: The name of the node to update
-            **kwargs: Key-value pairs to merge into the node's data
-
-        Note:
-            Uses dictionary unpacking for safe merging: {**existing, **new}
-            If the node doesn't exist, creates a new entry with the provided data.
+            **kwargs: NodeResult fields to set
 
         Example:
             task_context.update_node("ClassifyEvent",
                         response_model=response_model,
                         usage=completion.usage,
-                        details={
-                            "intent_type": "CREATE_EVENT",
-                            "confidence": 0.95,
-                        },
                     )
         """
-        self.nodes[node_name] = {**self.nodes.get(node_name, {}), **kwargs}
+        existing = self.nodes.get(node_name)
+        self.nodes[node_name] = replace(existing, **kwargs) if existing else NodeResult(**kwargs)
@@ -6,11 +6,17 @@ pool configuration, and environment-specific behavior.
 """
 
 from functools import lru_cache
+from uuid import uuid4
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _unique_statement_name() -> str:
+    """Name each prepared statement uniquely so pooled server connections never clash"""
+    return f"__asyncpg_{uuid4()}__"
+
+
 class DbConfig(BaseSettings):
     """Database service configuration."""
 
@@ -21,11 +27,26 @@ class DbConfig(BaseSettings):
     name: str = Field(default="postgres", alias="DATABASE_NAME")
     port: int = Field(default=6543, alias="DATABASE_PORT")
 
+    # Schema management (Alembic migrations own the schema when set)
+    skip_ddl: bool = Field(default=False, alias="SKIP_DDL")
+
     @property
     def url(self) -> str:
         """PostgreSQL connection string."""
         return f"postgresql://{self.user}:{self.password.get_secret_value()}@{self.host}:{self.port}/{self.name}"
 
+    @property
+    def async_url(self) -> str:
+        """PostgreSQL connection string for the asyncpg driver.
+
+        SQLAlchemy's own prepared statement cache is disabled, as transaction-mode
+        poolers (Supabase :6543) may route each statement to a different server connection.
+        """
+        return (
+            f"postgresql+asyncpg://{self.user}:{self.password.get_secret_value()}"
+            f"@{self.host}:{self.port}/{self.name}?prepared_statement_cache_size=0"
+        )
+
     @property
     def engine_options(self) -> dict:
         """SQLAlchemy engine options with PostgreSQL standards."""
@@ -39,6 +60,20 @@ class DbConfig(BaseSettings):
             "echo": False,
         }
 
+    @property
+    def async_engine_options(self) -> dict:
+        """SQLAlchemy async engine options with PostgreSQL standards."""
+        return {
+            **self.engine_options,
+            # Transaction-mode poolers (Supabase :6543) do not keep prepared statements:
+            # disable asyncpg's statement cache and use unique names for the statements
+            # asyncpg still prepares, per SQLAlchemy's pgbouncer guidance
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            },
+        }
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
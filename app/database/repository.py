@@ -6,18 +6,44 @@ It provides a generic repository class that can be used with any SQLAlchemy mode
 to perform CRUD operations in a consistent and reusable way.
 """
 
-from typing import Any, Generic, TypeVar
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.database.session import Base
 
-# Type variable for SQLAlchemy models
-ModelType = TypeVar("ModelType", bound=Base)
 
+class _RepositoryQueries[ModelType: Base]:
+    """
+    Query building shared by the sync and async repositories.
+
+    Each repository only executes these statements with its own session type,
+    so a query is defined once for both.
+    """
+
+    model: type[ModelType]
+
+    def _select_page(self, limit: int, offset: int) -> Select[tuple[ModelType]]:
+        """Select a page of records"""
+        return select(self.model).offset(offset).limit(limit)
+
+    def _select_count(self) -> Select[tuple[int]]:
+        """Select the total number of records"""
+        return select(func.count()).select_from(self.model)
+
+    def _select_filtered(self, **kwargs: Any) -> Select[tuple[ModelType]]:
+        """Select records matching the keyword criteria"""
+        return select(self.model).filter_by(**kwargs)
+
+    def _select_latest(self, limit: int) -> Select[tuple[ModelType]]:
+        """Select the most recent records ordered by creation time"""
+        return select(self.model).order_by(self.model.created_at.desc()).limit(limit)
 
-class GenericRepository(Generic[ModelType]):
+
+class GenericRepository[ModelType: Base](_RepositoryQueries[ModelType]):
     """
     Generic repository for CRUD operations on SQLAlchemy models.
 
@@ -116,7 +142,7 @@ class GenericRepository(Generic[ModelType]):
         Returns:
             Optional[ModelType]: The model instance if found, None otherwise
         """
-        return self.session.query(self.model).filter(self.model.id == id).first()
+        return self.session.get(self.model, id)
 
     def get_all(self, limit: int = 100, offset: int = 0) -> list[ModelType]:
         """
@@ -129,7 +155,7 @@ class GenericRepository(Generic[ModelType]):
         Returns:
             List[ModelType]: List of model instances
         """
-        return self.session.query(self.model).offset(offset).limit(limit).all()
+        return list(self.session.scalars(self._select_page(limit, offset)))
 
     def update(self, obj: ModelType) -> ModelType:
         """
@@ -182,7 +208,7 @@ class GenericRepository(Generic[ModelType]):
         Returns:
             int: Total number of records in the table
         """
-        return self.session.query(self.model).count()
+        return self.session.scalars(self._select_count()).one()
 
     def filter_by(self, **kwargs: Any) -> list[ModelType]:
         """
@@ -198,7 +224,7 @@ class GenericRepository(Generic[ModelType]):
             # Find events by workflow type
             events = repo.filter_by(workflow_type="calendar_request")
         """
-        return self.session.query(self.model).filter_by(**kwargs).all()
+        return list(self.session.scalars(self._select_filtered(**kwargs)))
 
     def get_latest(self, limit: int = 10) -> list[ModelType]:
         """
@@ -214,6 +240,150 @@ class GenericRepository(Generic[ModelType]):
             # Get the 5 most recent events
             recent_events = repo.get_latest(limit=5)
         """
-        return (
-            self.session.query(self.model).order_by(self.model.created_at.desc()).limit(limit).all()
-        )
+        return list(self.session.scalars(self._select_latest(limit)))
+
+
+class AsyncGenericRepository[ModelType: Base](_RepositoryQueries[ModelType]):
+    """
+    Async generic repository for CRUD operations on SQLAlchemy models.
+
+    Async counterpart of GenericRepository for the FastAPI path. It follows the same
+    flush() + refresh() transaction strategy; the caller (usually the
+    get_async_db_session() dependency) controls commit() and rollback().
+
+    Attributes:
+        session: SQLAlchemy async database session
+        model: SQLAlchemy model class
+
+    Example:
+        @app.post("/events")
+        async def create_event(data: dict, db: AsyncSession = Depends(get_async_db_session)):
+            repo = AsyncGenericRepository(session=db, model=Event)
+            event = await repo.create(Event(data=data))  # flush() only
+            return event  # Auto-commit when dependency completes
+    """
+
+    def __init__(self, session: AsyncSession, model: type[ModelType]):
+        """
+        Initialize the repository with an async database session and model.
+
+        Args:
+            session: SQLAlchemy async database session
+            model: SQLAlchemy model class
+        """
+        self.session = session
+        self.model = model
+
+    async def create(self, obj: ModelType) -> ModelType:
+        """
+        Create a new record in the database.
+
+        Args:
+            obj: Model instance to create
+
+        Returns:
+            ModelType: The created model instance with updated fields (including DB-generated ID)
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        self.session.add(obj)
+        await self.session.flush()  # Send to DB but don't commit (reversible)
+        await self.session.refresh(obj)  # Get DB-generated values (ID, timestamps)
+        return obj
+
+    async def get(self, id: UUID | str) -> ModelType | None:
+        """
+        Retrieve a record by its ID.
+
+        Args:
+            id: Primary key of the record to retrieve
+
+        Returns:
+            Optional[ModelType]: The model instance if found, None otherwise
+        """
+        return await self.session.get(self.model, id)
+
+    async def get_all(self, limit: int = 100, offset: int = 0) -> list[ModelType]:
+        """
+        Retrieve all records with pagination.
+
+        Args:
+            limit: Maximum number of records to return (default: 100)
+            offset: Number of records to skip (default: 0)
+
+        Returns:
+            List[ModelType]: List of model instances
+        """
+        return list(await self.session.scalars(self._select_page(limit, offset)))
+
+    async def update(self, obj: ModelType) -> ModelType:
+        """
+        Update an existing record in the database.
+
+        Args:
+            obj: Model instance with updated values
+
+        Returns:
+            ModelType: The updated model instance with refreshed DB values
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        await self.session.merge(obj)
+        await self.session.flush()  # Send UPDATE to DB but don't commit
+        await self.session.refresh(obj)  # Get updated values from DB
+        return obj
+
+    async def delete(self, id: UUID | str) -> bool:
+        """
+        Delete a record by its ID.
+
+        Args:
+            id: Primary key of the record to delete
+
+        Returns:
+            bool: True if record was deleted, False if not found
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        obj = await self.get(id)
+        if obj:
+            await self.session.delete(obj)
+            await self.session.flush()  # Send DELETE to DB but don't commit
+            return True
+        return False
+
+    async def count(self) -> int:
+        """
+        Count the total number of records.
+
+        Returns:
+            int: Total number of records in the table
+        """
+        return (await self.session.scalars(self._select_count())).one()
+
+    async def filter_by(self, **kwargs: Any) -> list[ModelType]:
+        """
+        Filter records by specified criteria.
+
+        Args:
+            **kwargs: Filter criteria as keyword arguments
+
+        Returns:
+            List[ModelType]: List of matching model instances
+        """
+        return list(await self.session.scalars(self._select_filtered(**kwargs)))
+
+    async def get_latest(self, limit: int = 10) -> list[ModelType]:
+        """
+        Retrieve the most recent records ordered by creation time.
+
+        Args:
+            limit: Maximum number of records to return (default: 10)
+
+        Returns:
+            List[ModelType]: List of model instances ordered by created_at DESC
+        """
+        return list(await self.session.scalars(self._select_latest(limit)))
@@ -6,11 +6,12 @@ It includes the declarative base, engine configuration, and session factory.
 """
 
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from fastapi import HTTPException
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.database.config import get_db_config
@@ -24,9 +25,16 @@ engine = create_engine(url=config.url, **config.engine_options)
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create the async engine and session factory for the FastAPI path
+async_engine = create_async_engine(url=config.async_url, **config.async_engine_options)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 # Create declarative base for models
 Base = declarative_base()
 
+# Advisory lock key serializing schema DDL across concurrent workers
+DDL_ADVISORY_LOCK_KEY = 424242
+
 
 def get_db_session() -> Generator[Session, None, None]:
     """
@@ -50,27 +58,67 @@ def get_db_session() -> Generator[Session, None, None]:
         session.commit()
     except SQLAlchemyError as ex:
         session.rollback()
-        logging.error("Database session error: %s", str(ex))
+        logging.error("Database session error: %s", ex)
         raise HTTPException(
             status_code=500,
             detail="Internal server error related to database operation",
         ) from ex
     except Exception as ex:
         session.rollback()
-        logging.error("Unexpected session error: %s", str(ex))
+        logging.error("Unexpected session error: %s", ex)
         raise HTTPException(status_code=500, detail="An unexpected error occurred") from None
     finally:
         session.close()
 
 
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async Database Session Dependency for FastAPI.
+
+    Async counterpart of get_db_session(). Database I/O is awaited on the event loop
+    instead of blocking a worker thread, so concurrent requests share one worker.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+
+    Example:
+        @app.get("/events")
+        async def get_events(db: AsyncSession = Depends(get_async_db_session)):
+            result = await db.execute(select(Event))
+            return result.scalars().all()
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except SQLAlchemyError as ex:
+            await session.rollback()
+            logging.error("Database session error: %s", ex)
+            raise HTTPException(
+                status_code=500,
+                detail="Internal server error related to database operation",
+            ) from ex
+        except Exception as ex:
+            await session.rollback()
+            logging.error("Unexpected session error: %s", ex)
+            raise HTTPException(status_code=500, detail="An unexpected error occurred") from None
+
+
 def create_tables():
     """
     Create all database tables.
 
     This function creates all tables defined by SQLAlchemy models
-    that inherit from the Base class.
+    that inherit from the Base class. DDL runs inside a transaction holding a
+    PostgreSQL advisory lock, so concurrent workers starting up together do not
+    race on the catalog. Skipped entirely when SKIP_DDL is set (Alembic owns schema).
     """
-    Base.metadata.create_all(bind=engine)
+    if config.skip_ddl:
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:k)"), {"k": DDL_ADVISORY_LOCK_KEY})
+        Base.metadata.create_all(bind=conn, checkfirst=True)
 
 
 def drop_tables():
@@ -80,4 +128,9 @@ def drop_tables():
     This function drops all tables defined by SQLAlchemy models.
     Use with caution - this will delete all data!
     """
-    Base.metadata.drop_all(bind=engine)
+    if config.skip_ddl:
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:k)"), {"k": DDL_ADVISORY_LOCK_KEY})
+        Base.metadata.drop_all(bind=conn, checkfirst=True)
@@ -5,16 +5,22 @@ Configuration for LLM providers using Pydantic Settings and Field validation.
 """
 
 from functools import lru_cache
+from pathlib import Path
 
+from dotenv import load_dotenv
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Read .env once at import instead of once per settings class instantiation.
+# Existing environment variables take precedence, matching pydantic-settings behavior.
+load_dotenv(".env", override=False)
+
 
 class LLMProviderSettings(BaseSettings):
     """Base settings for LLM providers."""
 
-    # Configure .env loading for all subclasses
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    # Environment is preloaded above; frozen settings are immutable after loading
+    model_config = SettingsConfigDict(extra="ignore", frozen=True)
 
 
 class OpenAISettings(LLMProviderSettings):
@@ -22,6 +28,7 @@ class OpenAISettings(LLMProviderSettings):
 
     api_key: SecretStr = Field(alias="OPENAI_API_KEY")
     default_model: str = Field(default="gpt-4o", alias="OPENAI_MODEL")
+    fast_model: str = Field(default="gpt-4o-mini", alias="OPENAI_FAST_MODEL")
     embedding_model: str = Field(default="text-embedding-3-small", alias="OPENAI_EMBEDDING_MODEL")
     temperature: float = Field(default=0.0, alias="OPENAI_TEMPERATURE")
     max_tokens: int = Field(default=2048, alias="OPENAI_MAX_TOKENS")
@@ -54,7 +61,55 @@ class LLMConfig(BaseSettings):
         alias="LLM_CONFIDENCE_THRESHOLD",
     )
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    # Validation runs on the fast model; less confident verdicts are re-run on the default model
+    validate_escalation_threshold: float = Field(
+        default=0.85,
+        ge=0.0,
+        le=1.0,
+        alias="LLM_VALIDATE_ESCALATION_THRESHOLD",
+    )
+
+    # Requests longer than this are rejected before validation reaches the LLM
+    validate_max_request_chars: int = Field(
+        default=2000, ge=1, alias="LLM_VALIDATE_MAX_REQUEST_CHARS"
+    )
+
+    # Keyword fast path that answers unambiguous create requests without an LLM call
+    fast_classify_enabled: bool = Field(default=False, alias="LLM_FAST_CLASSIFY_ENABLED")
+
+    # Stream classifications and stop once the decision fields are complete (no usage reported)
+    classify_stream_enabled: bool = Field(default=False, alias="LLM_CLASSIFY_STREAM_ENABLED")
+
+    # Stream validations and stop once the verdict fields are complete (no usage reported)
+    validate_stream_enabled: bool = Field(default=False, alias="LLM_VALIDATE_STREAM_ENABLED")
+
+    # Stream create extractions and stop once the event fields are complete (no usage reported)
+    extract_stream_enabled: bool = Field(default=False, alias="LLM_EXTRACT_STREAM_ENABLED")
+
+    # Keep-alive pool of the shared provider HTTP clients
+    http_max_keepalive_connections: int = Field(
+        default=32, ge=0, alias="LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_keepalive_expiry: float = Field(default=300.0, alias="LLM_HTTP_KEEPALIVE_EXPIRY")
+
+    # Maximum concurrent LLM requests for batch operations
+    batch_max_concurrency: int = Field(default=32, ge=1, alias="LLM_BATCH_MAX_CONCURRENCY")
+
+    # Exact-match response cache settings (0 disables the cache)
+    exact_cache_max_entries: int = Field(default=4096, alias="LLM_EXACT_CACHE_MAX_ENTRIES")
+
+    # Semantic response cache settings (opt-in; adds an embedding call to every cache miss)
+    semantic_cache_enabled: bool = Field(default=False, alias="LLM_SEMANTIC_CACHE_ENABLED")
+    semantic_cache_threshold: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        alias="LLM_SEMANTIC_CACHE_THRESHOLD",
+    )
+    semantic_cache_max_entries: int = Field(default=1024, alias="LLM_SEMANTIC_CACHE_MAX_ENTRIES")
+    semantic_cache_dir: Path | None = Field(default=None, alias="LLM_SEMANTIC_CACHE_DIR")
+
+    model_config = SettingsConfigDict(extra="ignore", frozen=True)
 
 
 @lru_cache
@@ -6,21 +6,148 @@ It supports multiple providers (OpenAI and Anthropic) and handles their
 initialization and configuration.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
 
+import httpx
 import instructor
-from anthropic import Anthropic
-from openai import OpenAI
+import openai
 from pydantic import BaseModel
 
 from app.llm.config import get_llm_config
+from app.logging.factory import logger
 
 T = TypeVar("T", bound=BaseModel)
 
+# Prompt and cached prompt token totals for monitoring the provider prompt cache hit rate.
+# Streamed completions report no usage and are not counted.
+prompt_cache_stats: Counter[str] = Counter()
+
+
+@lru_cache(maxsize=64)
+def prepare_response_model[T: BaseModel](response_model: type[T]) -> type[T]:
+    """
+    Wrap a response model in instructor's schema class once per process.
+
+    instructor wraps any plain BaseModel in a freshly created subclass on every call,
+    which rebuilds the pydantic class and misses its own schema cache. Passing the
+    pre-wrapped class skips the wrapping, so the tool schema is derived only once.
+
+    Args:
+        response_model: Pydantic model for response structure
+
+    Returns:
+        Subclass of response_model carrying the cached tool schema
+    """
+    return instructor.openai_schema(response_model)
+
+
+def cached_prompt_tokens(usage: Any) -> int | None:
+    """
+    Read the number of prompt tokens served from the provider's prompt cache.
+
+    Args:
+        usage: Usage object of an OpenAI or Anthropic completion
+
+    Returns:
+        Cached prompt tokens, or None if the usage does not report them
+    """
+    details = getattr(usage, "prompt_tokens_details", None)  # OpenAI
+    if details is not None:
+        return getattr(details, "cached_tokens", None)
+    return getattr(usage, "cache_read_input_tokens", None)  # Anthropic
+
+
+def record_prompt_cache_usage(usage: Any) -> None:
+    """
+    Add a completion's prompt and cached prompt tokens to prompt_cache_stats.
+
+    OpenAI's prompt_tokens include cached tokens; Anthropic reports cache reads and
+    writes apart from input_tokens, so they are added to get the full prompt size.
+
+    Args:
+        usage: Usage object of an OpenAI or Anthropic completion
+    """
+    cached_tokens = cached_prompt_tokens(usage) or 0
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    if prompt_tokens is None:
+        prompt_tokens = (
+            (getattr(usage, "input_tokens", None) or 0)
+            + (getattr(usage, "cache_creation_input_tokens", None) or 0)
+            + cached_tokens
+        )
+    if not prompt_tokens:
+        return
+
+    prompt_cache_stats["prompt_tokens"] += prompt_tokens
+    prompt_cache_stats["cached_tokens"] += cached_tokens
+    logger.debug(
+        "Prompt cache: %d/%d prompt tokens cached (%.0f%%, process: %.0f%%)",
+        cached_tokens,
+        prompt_tokens,
+        100 * cached_tokens / prompt_tokens,
+        100 * prompt_cache_stats["cached_tokens"] / prompt_cache_stats["prompt_tokens"],
+    )
+
 
 class LLMProvider(ABC):
-    """Abstract base class for LLM providers."""
+    """Abstract base class for LLM providers.
+
+    Sync clients are created once and shared by every caller in the process. Async
+    clients are created per event loop, since their connection pool cannot outlive
+    the loop that opened it. Pipelines share one long-lived loop per process, so
+    their async clients persist; each other asyncio.run() gets fresh ones.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        config = get_llm_config()
+        self.http_limits = httpx.Limits(
+            max_keepalive_connections=config.http_max_keepalive_connections,
+            keepalive_expiry=config.http_keepalive_expiry,
+        )
+        self._async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[Any, Any]] = (
+            WeakKeyDictionary()
+        )
+
+    def _loop_clients(self) -> tuple[Any, Any]:
+        """Get the raw and instructor async clients bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        clients = self._async_clients.get(loop)
+        if clients is None:
+            clients = self._create_async_clients()
+            self._async_clients[loop] = clients
+        return clients
+
+    @property
+    def raw_async_client(self) -> Any:
+        """Raw async SDK client for the running event loop"""
+        return self._loop_clients()[0]
+
+    @property
+    def async_client(self) -> Any:
+        """Instructor-wrapped async client for the running event loop"""
+        return self._loop_clients()[1]
+
+    @abstractmethod
+    def _create_async_clients(self) -> tuple[Any, Any]:
+        """Create the raw and instructor-wrapped async clients"""
+        pass
+
+    def _tuning_params(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Build tuning parameters with fallback to default settings"""
+        return {
+            "model": kwargs.get("model", self.settings.default_model),
+            "temperature": kwargs.get("temperature", self.settings.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.settings.max_tokens),
+            "max_retries": kwargs.get("max_retries", self.settings.max_retries),
+            "timeout": kwargs.get("timeout", self.settings.timeout),
+        }
 
     @abstractmethod
     def create_completion(
@@ -29,72 +156,197 @@ class LLMProvider(ABC):
         """Get structured completion from LLM"""
         pass
 
+    @abstractmethod
+    async def acreate_completion(
+        self, messages: list[dict[str, str]], response_model: type[T], **kwargs: Any
+    ) -> tuple[T, Any]:
+        """Get structured completion from LLM without blocking the event loop"""
+        pass
+
+    @abstractmethod
+    def astream_completion(
+        self, messages: list[dict[str, str]], response_model: type[T], **kwargs: Any
+    ) -> AsyncIterator[T]:
+        """Stream partially parsed structured completion from LLM"""
+        pass
+
+    def create_embedding(self, text: str) -> list[float]:
+        """Get embedding vector for the given text"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support embeddings")
+
+    async def acreate_embedding(self, text: str) -> list[float]:
+        """Get embedding vector for the given text without blocking the event loop"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support embeddings")
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI provider using native structured output"""
 
     def __init__(self, settings):
-        self.settings = settings
-        self.client = instructor.from_openai(
-            OpenAI(api_key=self.settings.api_key.get_secret_value())
+        super().__init__(settings)
+        self.raw_client = openai.OpenAI(
+            api_key=self.settings.api_key.get_secret_value(),
+            http_client=openai.DefaultHttpxClient(limits=self.http_limits),
+        )
+        self.client = instructor.from_openai(self.raw_client)
+
+    def _create_async_clients(self) -> tuple[Any, Any]:
+        """Create OpenAI async clients"""
+        raw_client = openai.AsyncOpenAI(
+            api_key=self.settings.api_key.get_secret_value(),
+            http_client=openai.DefaultAsyncHttpxClient(limits=self.http_limits),
         )
+        return raw_client, instructor.from_openai(raw_client)
 
     def create_completion(
         self, messages: list[dict[str, str]], response_model: type[T], **kwargs: Any
     ) -> tuple[T, Any]:
         """Use OpenAI's native structured output"""
+        return self.client.chat.completions.create_with_completion(
+            messages=messages, response_model=response_model, **self._tuning_params(kwargs)
+        )
 
-        # Build tuning parameters with fallback to default settings
-        tuning_params = {
-            "model": kwargs.get("model", self.settings.default_model),
-            "temperature": kwargs.get("temperature", self.settings.temperature),
-            "max_tokens": kwargs.get("max_tokens", self.settings.max_tokens),
-            "max_retries": kwargs.get("max_retries", self.settings.max_retries),
-            "timeout": kwargs.get("timeout", self.settings.timeout),
-        }
+    async def acreate_completion(
+        self, messages: list[dict[str, str]], response_model: type[T], **kwargs: Any
+    ) -> tuple[T, Any]:
+        """Use OpenAI's native structured output with the async client"""
+        return await self.async_client.chat.completions.create_with_completion(
+            messages=messages, response_model=response_model, **self._tuning_params(kwargs)
+        )
 
-        # Create the completion
-        return self.client.chat.completions.create_with_completion(
-            messages=messages, response_model=response_model, **tuning_params
+    def astream_completion(
+        self, messages: list[dict[str, str]], response_model: type[T], **kwargs: Any
+    ) -> AsyncIterator[T]:
+        """Stream OpenAI's structured output as partial models"""
+        # Partials are validated from parsed dicts, where strict mode rejects enum strings
+        return self.async_client.chat.completions.create_partial(
+            messages=messages,
+            response_model=response_model,
+            strict=False,
+            **self._tuning_params(kwargs),
         )
 
+    def create_embedding(self, text: str) -> list[float]:
+        """Use OpenAI's embedding endpoint"""
+        response = self.raw_client.embeddings.create(
+            model=self.settings.embedding_model,
+            input=text,
+            timeout=self.settings.timeout,
+        )
+        return response.data[0].embedding
+
+    async def acreate_embedding(self, text: str) -> list[float]:
+        """Use OpenAI's embedding endpoint with the async client"""
+        response = await self.raw_async_client.embeddings.create(
+            model=self.settings.embedding_model,
+            input=text,
+            timeout=self.settings.timeout,
+        )
+        return response.data[0].embedding
+
 
 class AnthropicProvider(LLMProvider):
-    """Anthropic provider using instructor for structured output."""
+    """Anthropic provider using instructor for structured output.
+
+    The anthropic SDK is imported when the provider is first created rather than with
+    this module: it takes ~0.8s to import, and the pipeline nodes only use OpenAI.
+    """
 
     def __init__(self, settings):
-        self.settings = settings
-        self.client = instructor.from_anthropic(
-            Anthropic(api_key=self.settings.api_key.get_secret_value())
+        super().__init__(settings)
+        import anthropic  # noqa: PLC0415 - deferred, the SDK takes ~0.8s to import
+
+        raw_client = anthropic.Anthropic(
+            api_key=self.settings.api_key.get_secret_value(),
+            http_client=anthropic.DefaultHttpxClient(limits=self.http_limits),
+        )
+        self.client = instructor.from_anthropic(raw_client)
+
+    def _create_async_clients(self) -> tuple[Any, Any]:
+        """Create Anthropic async clients"""
+        import anthropic  # noqa: PLC0415 - deferred, the SDK takes ~0.8s to import
+
+        raw_client = anthropic.AsyncAnthropic(
+            api_key=self.settings.api_key.get_secret_value(),
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=self.http_limits),
         )
+        return raw_client, instructor.from_anthropic(raw_client)
+
+    @staticmethod
+    def _split_messages(
+        messages: list[dict[str, str]],
+    ) -> tuple[list[dict[str, Any]] | None, list[dict[str, str]]]:
+        """Separate system and user messages, marking the first system prompt for caching"""
+        sys_blocks: list[dict[str, Any]] = [
+            {"type": "text", "text": m["content"]} for m in messages if m["role"] == "system"
+        ]
+        usr_msg = [m for m in messages if m["role"] != "system"]
+        if not sys_blocks:
+            return None, usr_msg
+        # Cached prefix ends after the static prompt; later system blocks carry per-request data
+        sys_blocks[0]["cache_control"] = {"type": "ephemeral"}
+        return sys_blocks, usr_msg
 
     def create_completion(
         self, messages: list[dict[str, str]], response_model: type[T], **kwargs: Any
     ) -> tuple[T, Any]:
         """Use instructor for structured output."""
+        sys_msg, usr_msg = self._split_messages(messages)
+        return self.client.messages.create_with_completion(
+            messages=usr_msg,
+            response_model=response_model,
+            system=sys_msg,
+            **self._tuning_params(kwargs),
+        )
 
-        # Separate system and user messages
-        sys_msg = next((m["content"] for m in messages if m["role"] == "system"), None)
-        usr_msg = [m for m in messages if m["role"] != "system"]
-
-        # Build tuning parameters with fallback to default settings
-        tuning_params = {
-            "model": kwargs.get("model", self.settings.default_model),
-            "temperature": kwargs.get("temperature", self.settings.temperature),
-            "max_tokens": kwargs.get("max_tokens", self.settings.max_tokens),
-            "max_retries": kwargs.get("max_retries", self.settings.max_retries),
-            "timeout": kwargs.get("timeout", self.settings.timeout),
-        }
+    async def acreate_completion(
+        self, messages: list[dict[str, str]], response_model: type[T], **kwargs: Any
+    ) -> tuple[T, Any]:
+        """Use instructor for structured output with the async client."""
+        sys_msg, usr_msg = self._split_messages(messages)
+        return await self.async_client.messages.create_with_completion(
+            messages=usr_msg,
+            response_model=response_model,
+            system=sys_msg,
+            **self._tuning_params(kwargs),
+        )
 
-        # Create the completion
-        return self.client.messages.create_with_completion(
+    def astream_completion(
+        self, messages: list[dict[str, str]], response_model: type[T], **kwargs: Any
+    ) -> AsyncIterator[T]:
+        """Use instructor to stream structured output as partial models."""
+        sys_msg, usr_msg = self._split_messages(messages)
+        return self.async_client.messages.create_partial(
             messages=usr_msg,
             response_model=response_model,
             system=sys_msg,
-            **tuning_params,
+            strict=False,
+            **self._tuning_params(kwargs),
         )
 
 
+SUPPORTED_PROVIDERS: dict[str, type[LLMProvider]] = {
+    "openai": OpenAIProvider,
+    "anthropic": AnthropicProvider,
+}
+
+
+@lru_cache(maxsize=8)
+def get_llm_provider(provider: str) -> LLMProvider:
+    """
+    Get the process-wide provider instance. Uses lru_cache so that every node shares
+    one SDK client and its connection pool instead of opening new connections per run.
+
+    Args:
+        provider: Name of the LLM provider
+
+    Returns:
+        LLMProvider: The shared provider instance.
+    """
+    settings = getattr(get_llm_config(), provider)
+    return SUPPORTED_PROVIDERS[provider](settings)
+
+
 class LLMFactory:
     """
     Factory class for creating and managing LLM provider instances.
@@ -109,26 +361,14 @@ class LLMFactory:
         llm_provider: The initialized LLM provider instance
     """
 
-    SUPPORTED_PROVIDERS = {"openai", "anthropic"}
-
     def __init__(self, provider: str):
         """Initialize the LLMService with the specified provider."""
-        if provider not in self.SUPPORTED_PROVIDERS:
+        if provider not in SUPPORTED_PROVIDERS:
             raise ValueError(f"Unsupported LLM provider: {provider}")
 
         self.provider = provider
-        config = get_llm_config()
-        self.settings = getattr(config, provider)
-        self.llm_provider = self._create_provider_instance()
-
-    def _create_provider_instance(self) -> LLMProvider:
-        """Create an instance of the specified LLM provider."""
-        providers = {
-            "openai": OpenAIProvider,
-            "anthropic": AnthropicProvider,
-        }
-
-        return providers[self.provider](self.settings)
+        self.llm_provider = get_llm_provider(provider)
+        self.settings = self.llm_provider.settings
 
     def create_completion(
         self,
@@ -154,9 +394,76 @@ class LLMFactory:
         if not issubclass(response_model, BaseModel):
             raise TypeError("response_model must be a Pydantic BaseModel")
 
-        return self.llm_provider.create_completion(
-            messages=messages, response_model=response_model, **kwargs
+        response, completion = self.llm_provider.create_completion(
+            messages=messages, response_model=prepare_response_model(response_model), **kwargs
+        )
+        record_prompt_cache_usage(getattr(completion, "usage", None))
+        return response, completion
+
+    async def acreate_completion(
+        self,
+        messages: list[dict[str, str]],
+        response_model: type[T],
+        **kwargs: Any,
+    ) -> tuple[T, Any]:
+        """
+        Create a completion using the configured LLM provider without blocking.
+
+        Async counterpart of create_completion(); awaits the provider's async client
+        so the event loop can serve other work during the round-trip.
+
+        Raises:
+            TypeError: If response_model not Pydantic model
+        """
+        if not issubclass(response_model, BaseModel):
+            raise TypeError("response_model must be a Pydantic BaseModel")
+
+        response, completion = await self.llm_provider.acreate_completion(
+            messages=messages, response_model=prepare_response_model(response_model), **kwargs
         )
+        record_prompt_cache_usage(getattr(completion, "usage", None))
+        return response, completion
+
+    def astream_completion(
+        self,
+        messages: list[dict[str, str]],
+        response_model: type[T],
+        **kwargs: Any,
+    ) -> AsyncIterator[T]:
+        """
+        Stream a completion as progressively filled partial models.
+
+        Each yielded model carries the fields parsed so far (unparsed fields are None);
+        the last one is complete. Streamed calls do not report token usage.
+
+        Raises:
+            TypeError: If response_model not Pydantic model
+        """
+        if not issubclass(response_model, BaseModel):
+            raise TypeError("response_model must be a Pydantic BaseModel")
+
+        return self.llm_provider.astream_completion(
+            messages=messages, response_model=prepare_response_model(response_model), **kwargs
+        )
+
+    def create_embedding(self, text: str) -> list[float]:
+        """
+        Create an embedding vector using the configured LLM provider.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            NotImplementedError: If the provider does not support embeddings
+        """
+        return self.llm_provider.create_embedding(text)
+
+    async def acreate_embedding(self, text: str) -> list[float]:
+        """Async counterpart of create_embedding()."""
+        return await self.llm_provider.acreate_embedding(text)
 
 
 # SDK - OpenAI
@@ -23,6 +23,7 @@ class LogConfig(BaseSettings):
     level: str = Field(default="DEBUG", alias="LOG_LEVEL")
     console_output: bool = Field(default=True, alias="LOG_CONSOLE_OUTPUT")
     file_output: bool = Field(default=True, alias="LOG_FILE_OUTPUT")
+    queue_output: bool = Field(default=True, alias="LOG_QUEUE_OUTPUT")
 
     # Application constants (hardcoded)
     name: str = "calendar_assistant"
@@ -5,10 +5,14 @@ Handles logger creation, context management, and runtime logging behavior.
 Provides the main logging interface for the application.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 import time
 from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from app.logging.config import LogConfig, get_log_config
@@ -20,14 +24,34 @@ _request_id: ContextVar[str] = ContextVar("request_id", default="--------")
 _service_tag: ContextVar[str] = ContextVar("service_tag", default="main")
 
 
+# Background listener draining the log queue (holds one listener when queue logging is enabled)
+_listeners: list[QueueListener] = []
+
+
+def _stamp_context(record: logging.LogRecord) -> None:
+    """Attach Service Tag and Request ID from the current context to the record"""
+    record.service_tag = f"[{_service_tag.get()}]"
+    record.request_id = f"[req:{_request_id.get()}]"
+
+
+class ContextFilter(logging.Filter):
+    """Filter that stamps context onto records in the emitting thread.
+
+    Required with queue logging: records are formatted on the listener thread,
+    where the request's context variables are not visible.
+    """
+
+    def filter(self, record):
+        _stamp_context(record)
+        return True
+
+
 class TaskFormatter(logging.Formatter):
     """Custom formatter that automatically includes Service Tag and Request ID from context"""
 
     def format(self, record):
-        service_tag = _service_tag.get()
-        request_id = _request_id.get()
-        record.service_tag = f"[{service_tag}]"
-        record.request_id = f"[req:{request_id}]"
+        if not hasattr(record, "service_tag"):
+            _stamp_context(record)
         return super().format(record)
 
 
@@ -72,7 +96,8 @@ def setup_service_logger(service_name: str, config: LogConfig | None = None) ->
         datefmt=config.date_format,
     )
 
-    # Create and add handlers based on configuration
+    # Create handlers based on configuration
+    handlers: list[logging.Handler] = []
     if config.file_output:
         # Ensure logs directory exists
         log_path = Path(config.file_path)
@@ -80,19 +105,55 @@ def setup_service_logger(service_name: str, config: LogConfig | None = None) ->
 
         file_handler = logging.FileHandler(log_path)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     if config.console_output:
         stream_handler = logging.StreamHandler(sys.stdout)
         stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
+        handlers.append(stream_handler)
+
+    # Attach handlers directly or behind a queue drained by a background thread
+    if config.queue_output and handlers:
+        queue_handler = QueueHandler(queue.SimpleQueue())
+        queue_handler.addFilter(ContextFilter())
+        logger.addHandler(queue_handler)
+        _start_listener(queue_handler, handlers)
+        os.register_at_fork(after_in_child=lambda: _start_listener(queue_handler, handlers))
+        atexit.register(stop_log_listener)  # Flush pending records on shutdown
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     # Set propagation based on configuration
     logger.propagate = config.propagate
 
     # Set service tag for this service
     set_service_tag(service_name)
-    logger.info(f"Logger initialized for service: {service_name}")
+    logger.info("Logger initialized for service: %s", service_name)
+
+
+def _start_listener(queue_handler: QueueHandler, handlers: list[logging.Handler]) -> None:
+    """
+    Start the background listener that writes queued records to the real handlers.
+
+    Also called in forked children (Celery prefork), which inherit the queue handler
+    but not the parent's listener thread; each child gets a fresh queue and listener.
+    """
+    queue_handler.queue = queue.SimpleQueue()
+    listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[:] = [listener]  # Replaces the parent's listener in a forked child
+
+
+def stop_log_listener() -> None:
+    """
+    Stop the queue listener after it has written out all pending records.
+
+    Runs at interpreter exit. Processes that exit via os._exit() skip atexit handlers
+    (Celery prefork children), so they must call it on their own shutdown hook.
+    """
+    while _listeners:
+        _listeners.pop().stop()
 
 
 # ================================ BASE LOGGER ================================
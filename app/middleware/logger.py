@@ -5,7 +5,7 @@ This middleware automatically injects request-specific context into logs.
 It generates correlation IDs for the API request. Passed to Celery tasks.
 """
 
-import uuid
+import secrets
 
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -19,8 +19,8 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
     """
 
     async def dispatch(self, request: Request, call_next):
-        # Generate correlation ID
-        correlation_id = str(uuid.uuid4())[:8]
+        # Generate 8-char correlation ID (4 random bytes, no UUID object or string slicing)
+        correlation_id = secrets.token_hex(4)
 
         # Set context automatically
         set_request_id(correlation_id)
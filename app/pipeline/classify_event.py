@@ -5,16 +5,83 @@ Node for event classification in the pipeline.
 Classifies the type of event requested.
 """
 
+import asyncio
+import logging
+import re
+from collections import Counter
+from contextlib import aclosing
 from typing import Any
 
 from app.core.exceptions import ErrorMessages, LLMServiceError, ValidationError
 from app.core.node import Node
+from app.core.schema.event import EventType
 from app.core.schema.task import TaskContext
 from app.llm.config import get_llm_config
 from app.llm.factory import LLMFactory
 from app.logging.factory import logger
 from app.pipeline.schema.classify import ClassifyContext, ClassifyResponse
+from app.services.exact_cache import get_exact_cache
 from app.services.prompt_loader import PromptManager
+from app.services.semantic_cache import get_semantic_cache
+from app.shared.text import normalize_request
+
+# All fast-path keywords merged into one alternation; each named group tags its category,
+# so a single scan yields the intents plus ambiguity markers. Requests are normalized
+# before the scan; IGNORECASE makes every alternative markedly slower.
+# Only create is answered locally: a misread delete removes events, so deletes (and
+# update/view words, which mark the request as mixed) always go to the LLM.
+_KEYWORD_RE = re.compile(
+    r"(?P<ambiguous_mark>\?)"
+    r"|\b(?:"
+    r"(?P<create_event>schedule|create|book|set up|arrange|pencil (?:me )?in)"
+    r"|(?P<delete_event>delete|cancel|remove|call off|scrap)"
+    r"|(?P<update_event>reschedule|update|modify|change|move|postpone|push back|rename|edit)"
+    r"|(?P<view_event>show|view|list|check|find|see|look|what's|what is|do i have)"
+    r"|(?P<ambiguous>maybe|perhaps|might|not|no|never|don't|dont|won't|can't|cannot|unsure"
+    r"|should|would|could|did|do|if|whether|when|remind|instead|anymore|mind)"
+    r")\b"
+)
+_INTENT_GROUPS = frozenset(event_type.value for event_type in EventType)
+
+# Fast-path hit/miss counters for threshold tuning
+fast_path_stats: Counter[str] = Counter()
+
+
+def _fast_classify(request: str) -> ClassifyResponse | None:
+    """Classify unambiguous create requests by keyword without an LLM call.
+
+    Returns a synthesized response if create is the only intent class matched and no
+    negation, question or ambiguity markers are present, otherwise None so the caller
+    falls through to the LLM.
+    """
+    markers = {match.lastgroup for match in _KEYWORD_RE.finditer(normalize_request(request))}
+    if "ambiguous" in markers or "ambiguous_mark" in markers:
+        return None
+
+    if markers & _INTENT_GROUPS != {EventType.CREATE_EVENT.value}:
+        return None
+
+    # Trusted, locally built values - skip field validation
+    return ClassifyResponse.model_construct(
+        has_intent=True,
+        request_type=EventType.CREATE_EVENT,
+        is_bulk_operation=False,
+        confidence_score=0.95,
+        reasoning=f"Keyword match: {EventType.CREATE_EVENT.value}",
+    )
+
+
+def _is_semantically_cacheable(response_model: ClassifyResponse) -> bool:
+    """Whether a classification may be served for a similar, not identical, request.
+
+    A near-miss that turns "cancel my 3pm" into "cancel all my meetings" must never
+    reach a destructive action, so delete and bulk classifications are only reused by
+    the exact-match cache.
+    """
+    return (
+        response_model.request_type != EventType.DELETE_EVENT
+        and not response_model.is_bulk_operation
+    )
 
 
 class ClassifyEvent(Node):
@@ -24,48 +91,142 @@ class ClassifyEvent(Node):
         """Initialize classifier"""
         config = get_llm_config()
         self.confidence_threshold = config.confidence_threshold
+        self.batch_max_concurrency = config.batch_max_concurrency
+        self.fast_classify_enabled = config.fast_classify_enabled
+        self.stream_enabled = config.classify_stream_enabled
         self.llm_provider = LLMFactory("openai")
+        self.exact_cache = get_exact_cache(self.node_name)
+        self.cache = (
+            get_semantic_cache(self.node_name, ClassifyResponse)
+            if config.semantic_cache_enabled
+            else None
+        )
         logger.info("Initialized %s", self.node_name)
 
     def get_context(self, task_context: TaskContext) -> ClassifyContext:
         """Extract context for intent classification"""
         return ClassifyContext(request=task_context.event.request)
 
-    def create_completion(self, context: ClassifyContext) -> tuple[ClassifyResponse, Any]:
-        """Get validation results from LLM"""
+    async def acreate_completion(self, context: ClassifyContext) -> tuple[ClassifyResponse, Any]:
+        """Get classification results from keyword fast path, caches or LLM"""
+        fast_model = _fast_classify(context.request) if self.fast_classify_enabled else None
+        fast_path_stats["hit" if fast_model else "miss"] += 1
+        if fast_model is not None:
+            logger.debug(
+                "Keyword fast path hit (%d/%d)",
+                fast_path_stats["hit"],
+                fast_path_stats.total(),
+            )
+            return fast_model, None
+
+        cached_model = self.exact_cache.lookup(context.request)
+        if cached_model is not None:
+            logger.debug("Exact-match cache hit")
+            return cached_model, None
+
+        embedding = await self._aembed_request(context.request)
+        if embedding is not None:
+            cached_model = self.cache.lookup(embedding)  # type: ignore
+            if cached_model is not None and _is_semantically_cacheable(cached_model):
+                self.exact_cache.insert(context.request, cached_model)
+                return cached_model, None
+
         prompt = PromptManager.get_prompt("classify_event_request")
-        response_model, completion = self.llm_provider.create_completion(
-            response_model=ClassifyResponse,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompt,
-                },
-                {
-                    "role": "user",
-                    "content": context.request,
-                },
-            ],
-        )
+        messages = [
+            {
+                "role": "system",
+                "content": prompt,
+            },
+            {
+                "role": "user",
+                "content": context.request,
+            },
+        ]
+        if self.stream_enabled:
+            response_model, completion = await self._astream_classification(messages), None
+        else:
+            response_model, completion = await self.llm_provider.acreate_completion(
+                response_model=ClassifyResponse, messages=messages
+            )
+
+        if self._is_classified(response_model):
+            self.exact_cache.insert(context.request, response_model)
+            if embedding is not None and _is_semantically_cacheable(response_model):
+                self.cache.insert(embedding, response_model)  # type: ignore
+                if self.cache.save_due:  # type: ignore
+                    await asyncio.to_thread(self.cache.save)  # type: ignore
+
         return response_model, completion
 
+    async def _astream_classification(self, messages: list[dict[str, str]]) -> ClassifyResponse:
+        """Stream the classification and return as soon as a confident decision is final.
+
+        Fields are generated in schema order, so once reasoning starts the decision fields
+        are complete. A confident decision returns without waiting for the reasoning to
+        finish decoding; otherwise the stream is read to the end for the full reasoning.
+        """
+        partial = None
+        decided = False
+        stream = self.llm_provider.astream_completion(
+            messages=messages, response_model=ClassifyResponse
+        )
+        async with aclosing(stream) as partials:
+            async for partial in partials:
+                decision = (partial.has_intent, partial.confidence_score, partial.reasoning)
+                if decided or None in decision:
+                    continue
+                decided = True
+                candidate = self._complete_response(partial)
+                if self._is_classified(candidate):
+                    logger.debug("Classification decided before reasoning completed")
+                    return candidate
+
+        if partial is None:
+            raise ValueError("Empty classification stream")
+        return self._complete_response(partial)
+
+    @staticmethod
+    def _complete_response(partial: Any) -> ClassifyResponse:
+        """Validate a streamed partial into a plain ClassifyResponse"""
+        return ClassifyResponse.model_validate(
+            {name: getattr(partial, name) for name in ClassifyResponse.model_fields}
+        )
+
+    async def _aembed_request(self, request: str) -> list[float] | None:
+        """Embed the request for cache lookup. Cache failures never fail the node."""
+        if self.cache is None:
+            return None
+        try:
+            return await self.llm_provider.acreate_embedding(request.strip())
+        except Exception as e:
+            logger.warning("Semantic cache unavailable: %s", e)
+            return None
+
+    def _is_classified(self, response_model: ClassifyResponse) -> bool:
+        """Whether the response carries a confident, usable classification"""
+        return (
+            response_model.has_intent
+            and response_model.request_type is not None
+            and response_model.confidence_score >= self.confidence_threshold
+        )
+
     def process(self, task_context: TaskContext) -> TaskContext:
-        """Process intent classification"""
+        """Process intent classification (sync entry point for the pipeline)"""
+        return asyncio.run(self.aprocess(task_context))
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        """Process intent classification without blocking the event loop"""
         context = self.get_context(task_context)
 
         try:
-            response_model, completion = self.create_completion(context)
+            response_model, completion = await self.acreate_completion(context)
         except Exception as llm_error:
             raise LLMServiceError(
                 ErrorMessages.llm_failed("classification", str(llm_error))
             ) from llm_error
 
         # Event classification logic
-        is_classified = (
-            response_model.has_intent
-            and response_model.request_type is not None
-            and response_model.confidence_score >= self.confidence_threshold
-        )
+        is_classified = self._is_classified(response_model)
 
         if not is_classified:
             raise ValidationError(ErrorMessages.validation_failed(response_model.reasoning))
@@ -74,19 +235,53 @@ class ClassifyEvent(Node):
         task_context.update_node(
             self.node_name,
             response_model=response_model,
-            usage=completion.usage,
+            usage=completion.usage if completion else None,
         )
 
         self._log_classification_results(is_classified, response_model)
 
         return task_context
 
+    def classify_batch(self, requests: list[str]) -> list[ClassifyResponse]:
+        """Classify multiple requests concurrently (sync entry point)"""
+        return asyncio.run(self.aclassify_batch(requests))
+
+    async def aclassify_batch(self, requests: list[str]) -> list[ClassifyResponse]:
+        """Classify multiple requests concurrently.
+
+        The LLM round-trip dominates each classification, so requests are issued
+        concurrently (bounded by batch_max_concurrency) rather than one after another.
+
+        Args:
+            requests: Natural language event requests
+
+        Returns:
+            Classification results in the same order as the requests
+
+        Raises:
+            LLMServiceError: If any classification call fails
+        """
+        semaphore = asyncio.Semaphore(self.batch_max_concurrency)
+
+        async def _classify_one(request: str) -> ClassifyResponse:
+            async with semaphore:
+                response_model, _ = await self.acreate_completion(ClassifyContext(request=request))
+                return response_model
+
+        try:
+            return list(await asyncio.gather(*(_classify_one(req) for req in requests)))
+        except Exception as llm_error:
+            raise LLMServiceError(
+                ErrorMessages.llm_failed("batch classification", str(llm_error))
+            ) from llm_error
+
     def _log_classification_results(self, is_valid: bool, response: ClassifyResponse):
         """Log classification results with summary and details"""
         if is_valid:
+            request_type = response.request_type.value if response.request_type else None
             logger.info(
                 "Intent classified as '%s' (confidence: %.2f)",
-                response.request_type.value if response.request_type else None,
+                request_type,
                 response.confidence_score,
             )
             return
@@ -102,8 +297,9 @@ class ClassifyEvent(Node):
         logger.info("Classification failed (%s)", ", ".join(failures))
 
         # Log details at DEBUG level
-        logger.debug(
-            "Classification details: %s (confidence: %.2f)",
-            response.reasoning,
-            response.confidence_score,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Classification details: %s (confidence: %.2f)",
+                response.reasoning,
+                response.confidence_score,
+            )
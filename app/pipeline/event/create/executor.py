@@ -5,9 +5,9 @@ Execution node for event creation in the pipeline.
 Handles the creation of calendar events using the Google Calendar API.
 """
 
-from app.calendar.auth import GoogleAuthClient
+from app.calendar.auth import get_google_auth_client
 from app.calendar.config import get_calendar_config
-from app.calendar.schema import GoogleEventResponse, create_event_model_to_request
+from app.calendar.schema import create_event_model_to_request, event_response_from_api
 from app.calendar.service import GoogleCalendarService
 from app.core.exceptions import CalServiceError, ErrorMessages, ValidationError
 from app.core.node import Node
@@ -21,21 +21,21 @@ class CreateEventExecutor(Node):
     def __init__(self):
         """Initialize with Google Calendar client."""
         config = get_calendar_config()
-        self.client = GoogleAuthClient()
+        self.client = get_google_auth_client()
         self.calendar_id = config.calendar_id
         logger.info("Initialized %s", self.node_name)
 
     def process(self, task_context: TaskContext) -> TaskContext:
         """Create event using extracted data."""
         # Get extracted event data
-        extractor_result = task_context.nodes.get("CreateEventExtractor", {})
-        if not extractor_result or "response_model" not in extractor_result:
+        extractor_result = task_context.nodes.get("CreateEventExtractor")
+        if not extractor_result or extractor_result.response_model is None:
             raise ValidationError(
                 ErrorMessages.validation_failed("event details could not be extracted from request")
             )
 
         # Get validated event model
-        event_model = extractor_result["response_model"]
+        event_model = extractor_result.response_model
 
         # Convert to Google API request model
         create_request = create_event_model_to_request(model=event_model)
@@ -53,8 +53,8 @@ class CreateEventExecutor(Node):
         except Exception as e:
             raise CalServiceError(ErrorMessages.calendar_failed("event creation", str(e))) from e
 
-        # Validate response with schema
-        created_event = GoogleEventResponse(**created_event_raw)
+        # Trusted API response - build the model without re-validation
+        created_event = event_response_from_api(created_event_raw)
 
         # Store result
         task_context.update_node(
@@ -6,16 +6,28 @@ Extracts event details from event request using LLM call.
 Pydantic response model is validated before passed to the next node in the pipeline.
 """
 
+import asyncio
+import logging
+from contextlib import aclosing
 from typing import Any
 
+from pydantic import ValidationError
+
+from app.calendar.auth import get_google_auth_client
 from app.core.exceptions import ErrorMessages, LLMServiceError
 from app.core.node import Node
 from app.core.schema.task import TaskContext
+from app.llm.config import get_llm_config
 from app.llm.factory import LLMFactory
 from app.logging.factory import logger
 from app.pipeline.schema.create import CreateContext, CreateResponse
+from app.services.exact_cache import get_exact_cache
 from app.services.prompt_loader import PromptManager
-from app.shared.datetime import get_datetime_reference
+from app.shared.datetime import format_datetime_reference, get_datetime_reference
+from app.shared.text import is_clock_relative
+
+# Stands in for the reasoning of a streamed extraction, which returns before it is decoded
+STREAMED_REASONING = "Not recorded: extraction returned before reasoning was generated"
 
 
 class CreateEventExtractor(Node):
@@ -23,7 +35,10 @@ class CreateEventExtractor(Node):
 
     def __init__(self):
         """Initialize extractor"""
+        self.stream_enabled = get_llm_config().extract_stream_enabled
         self.llm_provider = LLMFactory("openai")
+        self.auth_client = get_google_auth_client()
+        self.cache = get_exact_cache(self.node_name, normalize_keys=False)
         logger.info("Initialized %s", self.node_name)
 
     def get_context(self, task_context: TaskContext) -> CreateContext:
@@ -32,54 +47,115 @@ class CreateEventExtractor(Node):
             request=task_context.event.request, datetime_ref=get_datetime_reference()
         )
 
-    def create_completion(self, context: CreateContext) -> tuple[CreateResponse, Any]:
+    async def acreate_completion(self, context: CreateContext) -> tuple[CreateResponse, Any]:
         """Extract and normalize event details using LLM with upfront datetime reference"""
-        prompt = PromptManager.get_prompt(
-            "create_event_extraction",
-            datetime=context.datetime_ref.dateTime,
-            timezone=context.datetime_ref.timeZone,
+        # Static prompt first so providers can reuse its cached prefix across requests
+        prompt = PromptManager.get_prompt("create_event_extraction")
+        messages = [
+            {
+                "role": "system",
+                "content": prompt,
+            },
+            {
+                "role": "system",
+                "content": format_datetime_reference(context.datetime_ref),
+            },
+            {
+                "role": "user",
+                "content": context.request,
+            },
+        ]
+        if self.stream_enabled:
+            response_model = await self._astream_extraction(messages)
+            if response_model is not None:
+                return response_model, None
+
+        return await self.llm_provider.acreate_completion(
+            response_model=CreateResponse, messages=messages
         )
-        response_model, completion = self.llm_provider.create_completion(
-            response_model=CreateResponse,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompt,
-                },
-                {
-                    "role": "user",
-                    "content": context.request,
-                },
-            ],
+
+    async def _astream_extraction(self, messages: list[dict[str, str]]) -> CreateResponse | None:
+        """Stream the extraction and return as soon as the event fields are final.
+
+        Fields are generated in schema order, so once reasoning starts the event fields
+        are complete and the reasoning tail is not awaited. The partial reasoning is
+        discarded and replaced with STREAMED_REASONING, so a truncated explanation is never
+        logged or cached. Returns None if the streamed fields fail validation, so the
+        caller falls back to a completion with retries.
+        """
+        partial = None
+        stream = self.llm_provider.astream_completion(
+            messages=messages, response_model=CreateResponse
         )
+        async with aclosing(stream) as partials:
+            async for partial in partials:
+                if partial.reasoning is not None:
+                    break
 
-        return response_model, completion
+        if partial is None:
+            return None
+        try:
+            fields = {name: getattr(partial, name) for name in CreateResponse.model_fields}
+            return CreateResponse.model_validate(fields | {"reasoning": STREAMED_REASONING})
+        except ValidationError as e:
+            logger.debug("Streamed extraction invalid, retrying without streaming: %s", e)
+            return None
 
     def process(self, task_context: TaskContext) -> TaskContext:
-        """Process event extraction and normalization"""
+        """Process event extraction and normalization (sync entry point for the pipeline)"""
+        return asyncio.run(self.aprocess(task_context))
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        """Process event extraction and normalization without blocking the event loop"""
         context = self.get_context(task_context)
 
+        cache_key = self._cache_key(context)
+        cached_model = self.cache.lookup(cache_key) if cache_key else None
+        if cached_model is not None:
+            logger.debug("Extraction cache hit")
+            task_context.update_node(self.node_name, response_model=cached_model)
+            self._log_results(cached_model)
+            return task_context
+
         try:
-            response_model, completion = self.create_completion(context)
+            # Authenticate for the executor while the LLM call is in flight
+            (response_model, completion), _ = await asyncio.gather(
+                self.acreate_completion(context), asyncio.to_thread(self.auth_client.prewarm)
+            )
         except Exception as llm_error:
             raise LLMServiceError(
                 ErrorMessages.llm_failed("extraction", str(llm_error))
             ) from llm_error
 
+        if cache_key:
+            self.cache.insert(cache_key, response_model)
+
         # Store result
         task_context.update_node(
             self.node_name,
             response_model=response_model,
-            usage=completion.usage,
+            usage=completion.usage if completion else None,
         )
 
         self._log_results(response_model)
 
         return task_context
 
+    @staticmethod
+    def _cache_key(context: CreateContext) -> str | None:
+        """Build the extraction cache key, or None if the request depends on the clock time.
+
+        Relative dates ("tomorrow at 3pm", "next Friday") resolve the same way throughout
+        a day, so an extraction can be reused for the same request, date and timezone.
+        """
+        if is_clock_relative(context.request):
+            return None
+        reference_date = context.datetime_ref.dateTime[:10]
+        return f"{reference_date} {context.datetime_ref.timeZone} {context.request}"
+
     def _log_results(self, response: CreateResponse):
         """Log extraction results"""
         logger.info("Extracted event details: '%s'", response.summary)
-        if response.parsing_issues:
+        if response.parsing_issues and logger.isEnabledFor(logging.DEBUG):
             logger.debug("Parsing issues: %s", ", ".join(response.parsing_issues))
         logger.debug("Extraction reasoning: %s", response.reasoning)
@@ -5,7 +5,7 @@ Execution node for event deletion in the pipeline.
 Handles the deletion of calendar events using the Google Calendar API.
 """
 
-from app.calendar.auth import GoogleAuthClient
+from app.calendar.auth import get_google_auth_client
 from app.calendar.config import get_calendar_config
 from app.calendar.schema import GoogleLookupEventResponse
 from app.calendar.service import GoogleCalendarService
@@ -21,15 +21,15 @@ class DeleteEventExecutor(Node):
     def __init__(self):
         """Initialize with Google Calendar client."""
         config = get_calendar_config()
-        self.client = GoogleAuthClient()
+        self.client = get_google_auth_client()
         self.calendar_id = config.calendar_id
         logger.info("Initialized %s", self.node_name)
 
     def process(self, task_context: TaskContext) -> TaskContext:
         """Delete events using lookup results."""
         # Get event lookup results
-        lookup_result = task_context.nodes.get("LookupEventExecutor", {})
-        if not lookup_result or "response_model" not in lookup_result:
+        lookup_result = task_context.nodes.get("LookupEventExecutor")
+        if not lookup_result or lookup_result.response_model is None:
             raise ValidationError(
                 ErrorMessages.validation_failed(
                     "target events for deletion could not be identified"
@@ -37,24 +37,20 @@ class DeleteEventExecutor(Node):
             )
 
         # Get validated events to delete
-        found_events = lookup_result["response_model"]
+        found_events = lookup_result.response_model
 
         try:
             # Initialize calendar service
             service = self.client.authenticate()
             calendar_service = GoogleCalendarService(service)
 
-            # Delete all found events
-            deleted_events = GoogleLookupEventResponse(items=[])
-
-            for event in found_events.items:
-                # Delete the event
-                calendar_service.delete_event(
-                    calendar_id=self.calendar_id,
-                    event=event,
-                    sendUpdates="none",  # Default to no notifications
-                )
-                deleted_events.items.append(event)
+            # Delete all found events in batched round-trips
+            deleted_items = calendar_service.batch_delete_events(
+                calendar_id=self.calendar_id,
+                events=found_events.items,
+                sendUpdates="none",  # Default to no notifications
+            )
+            deleted_events = GoogleLookupEventResponse(items=deleted_items)
         except Exception as e:
             raise CalServiceError(ErrorMessages.calendar_failed("event deletion", str(e))) from e
 
@@ -3,11 +3,11 @@ Lookup event node for the pipeline.
 Handles the retrieval of calendar events.
 """
 
-from app.calendar.auth import GoogleAuthClient
+from app.calendar.auth import get_google_auth_client
 from app.calendar.config import get_calendar_config
 from app.calendar.schema import (
-    GoogleEventResponse,
     GoogleLookupEventResponse,
+    event_response_from_api,
     lookup_event_model_to_request,
 )
 from app.calendar.service import GoogleCalendarService
@@ -23,15 +23,15 @@ class LookupEventExecutor(Node):
     def __init__(self):
         """Initialize with Google Calendar client."""
         config = get_calendar_config()
-        self.client = GoogleAuthClient()
+        self.client = get_google_auth_client()
         self.calendar_id = config.calendar_id
         logger.info("Initialized %s", self.node_name)
 
     def process(self, task_context: TaskContext) -> TaskContext:
         """Look up events using search criteria."""
         # Get extracted event search parameters
-        extractor_result = task_context.nodes.get("LookupEventExtractor", {})
-        if not extractor_result or "response_model" not in extractor_result:
+        extractor_result = task_context.nodes.get("LookupEventExtractor")
+        if not extractor_result or extractor_result.response_model is None:
             raise ValidationError(
                 ErrorMessages.validation_failed(
                     "event search criteria could not be extracted from request"
@@ -39,7 +39,7 @@ class LookupEventExecutor(Node):
             )
 
         # Get validated event search parameters
-        search_params = extractor_result["response_model"]
+        search_params = extractor_result.response_model
 
         try:
             # Initialize calendar service
@@ -70,11 +70,10 @@ class LookupEventExecutor(Node):
         except Exception as e:
             raise CalServiceError(ErrorMessages.calendar_failed("event lookup", str(e))) from e
 
-        # Validate each event with schema
-        validated_events = [GoogleEventResponse(**event) for event in events_raw if event]
-
-        # Create lookup response
-        found_events = GoogleLookupEventResponse(items=validated_events)
+        # Trusted API responses - build the models without re-validation
+        found_events = GoogleLookupEventResponse(
+            items=[event_response_from_api(event) for event in events_raw]
+        )
 
         # Validate results
         if not found_events.items:
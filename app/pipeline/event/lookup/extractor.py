@@ -6,16 +6,47 @@ Extracts event details from event request using LLM call.
 Pydantic response model is validated before passed to the next node in the pipeline.
 """
 
+import asyncio
+import logging
+import re
 from typing import Any
 
+from app.calendar.auth import get_google_auth_client
 from app.core.exceptions import ErrorMessages, LLMServiceError
 from app.core.node import Node
 from app.core.schema.task import TaskContext
 from app.llm.factory import LLMFactory
 from app.logging.factory import logger
 from app.pipeline.schema.lookup import LookupContext, LookupResponse
+from app.services.exact_cache import get_exact_cache
 from app.services.prompt_loader import PromptManager
-from app.shared.datetime import get_datetime_reference
+from app.shared.datetime import format_datetime_reference, get_datetime_reference
+from app.shared.text import is_clock_relative
+
+# Google-generated event IDs: 20+ base32hex characters (26 by default) mixing letters and
+# digits, with an optional _YYYYMMDD[THHMMSSZ] suffix on recurring event instances
+_EVENT_ID_RE = re.compile(
+    r"\b(?=[a-v0-9]*\d)(?=[a-v0-9]*[a-v])[a-v0-9]{20,1024}(?:_\d{8}(?:T\d{6}Z)?)?\b"
+)
+
+
+def _match_event_id(request: str) -> LookupResponse | None:
+    """Build lookup criteria for a request naming exactly one explicit event ID.
+
+    Returns a synthesized response so the caller skips the LLM call, otherwise None.
+    """
+    event_ids = set(_EVENT_ID_RE.findall(request))
+    if len(event_ids) != 1:
+        return None
+
+    # Trusted, locally built values - skip field validation
+    return LookupResponse.model_construct(
+        event_id=event_ids.pop(),
+        time_window=None,
+        context_terms=[],
+        parsing_issues=[],
+        reasoning="Explicit event ID in request",
+    )
 
 
 class LookupEventExtractor(Node):
@@ -24,6 +55,8 @@ class LookupEventExtractor(Node):
     def __init__(self):
         """Initialize extractor"""
         self.llm_provider = LLMFactory("openai")
+        self.auth_client = get_google_auth_client()
+        self.cache = get_exact_cache(self.node_name, normalize_keys=False)
         logger.info("Initialized %s", self.node_name)
 
     def get_context(self, task_context: TaskContext) -> LookupContext:
@@ -31,26 +64,25 @@ class LookupEventExtractor(Node):
         return LookupContext(
             request=task_context.event.request,
             datetime_ref=get_datetime_reference(),
-            is_bulk_operation=task_context.nodes["ClassifyEvent"][
-                "response_model"
-            ].is_bulk_operation,
+            is_bulk_operation=task_context.nodes["ClassifyEvent"].response_model.is_bulk_operation,
         )
 
-    def create_completion(self, context: LookupContext) -> tuple[LookupResponse, Any]:
+    async def acreate_completion(self, context: LookupContext) -> tuple[LookupResponse, Any]:
         """Extract search criteria using LLM"""
-        prompt = PromptManager.get_prompt(
-            "lookup_event_extraction",
-            datetime=context.datetime_ref.dateTime,
-            timezone=context.datetime_ref.timeZone,
-            is_bulk_operation=context.is_bulk_operation,
-        )
-        response_model, completion = self.llm_provider.create_completion(
+        # Static prompt first so providers can reuse its cached prefix across requests
+        prompt = PromptManager.get_prompt("lookup_event_extraction")
+        reference = format_datetime_reference(context.datetime_ref)
+        response_model, completion = await self.llm_provider.acreate_completion(
             response_model=LookupResponse,
             messages=[
                 {
                     "role": "system",
                     "content": prompt,
                 },
+                {
+                    "role": "system",
+                    "content": f"{reference}\nBulk operation flag: {context.is_bulk_operation}",
+                },
                 {
                     "role": "user",
                     "content": context.request,
@@ -61,16 +93,42 @@ class LookupEventExtractor(Node):
         return response_model, completion
 
     def process(self, task_context: TaskContext) -> TaskContext:
-        """Process lookup criteria extraction"""
+        """Process lookup criteria extraction (sync entry point for the pipeline)"""
+        return asyncio.run(self.aprocess(task_context))
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        """Process lookup criteria extraction without blocking the event loop"""
         context = self.get_context(task_context)
 
+        # A single explicit event ID needs no extraction; bulk requests go to the LLM
+        id_model = None if context.is_bulk_operation else _match_event_id(context.request)
+        if id_model is not None:
+            logger.debug("Event ID fast path hit")
+            task_context.update_node(self.node_name, response_model=id_model)
+            self._log_results(id_model)
+            return task_context
+
+        cache_key = self._cache_key(context)
+        cached_model = self.cache.lookup(cache_key) if cache_key else None
+        if cached_model is not None:
+            logger.debug("Lookup extraction cache hit")
+            task_context.update_node(self.node_name, response_model=cached_model)
+            self._log_results(cached_model)
+            return task_context
+
         try:
-            response_model, completion = self.create_completion(context)
+            # Authenticate for the executor while the LLM call is in flight
+            (response_model, completion), _ = await asyncio.gather(
+                self.acreate_completion(context), asyncio.to_thread(self.auth_client.prewarm)
+            )
         except Exception as llm_error:
             raise LLMServiceError(
                 ErrorMessages.llm_failed("lookup extraction", str(llm_error))
             ) from llm_error
 
+        if cache_key:
+            self.cache.insert(cache_key, response_model)
+
         # Store result
         task_context.update_node(
             self.node_name,
@@ -82,6 +140,19 @@ class LookupEventExtractor(Node):
 
         return task_context
 
+    @staticmethod
+    def _cache_key(context: LookupContext) -> str | None:
+        """Build the extraction cache key, or None if the request depends on the clock time.
+
+        The bulk flag changes the extracted context terms, so it is part of the key along
+        with the request, date and timezone.
+        """
+        if is_clock_relative(context.request):
+            return None
+        reference_date = context.datetime_ref.dateTime[:10]
+        bulk = "bulk" if context.is_bulk_operation else "single"
+        return f"{reference_date} {context.datetime_ref.timeZone} {bulk} {context.request}"
+
     def _log_results(self, response: LookupResponse):
         """Log extraction results"""
         # Log primary search criteria
@@ -95,6 +166,6 @@ class LookupEventExtractor(Node):
             )
 
         # Log any issues and reasoning
-        if response.parsing_issues:
+        if response.parsing_issues and logger.isEnabledFor(logging.DEBUG):
             logger.debug("Parsing issues: %s", ", ".join(response.parsing_issues))
         logger.debug("Extraction reasoning: %s", response.reasoning)
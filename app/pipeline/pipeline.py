@@ -7,14 +7,13 @@ Implements workflow logic for routing and handling different event types.
 
 from app.core.pipeline import Pipeline
 from app.core.schema.pipeline import NodeConfig, PipelineSchema
-from app.pipeline.classify_event import ClassifyEvent
 from app.pipeline.event.create.executor import CreateEventExecutor
 from app.pipeline.event.create.extractor import CreateEventExtractor
 from app.pipeline.event.delete.executor import DeleteEventExecutor
 from app.pipeline.event.lookup.executor import LookupEventExecutor
 from app.pipeline.event.lookup.extractor import LookupEventExtractor
 from app.pipeline.route_event import RouteEvent
-from app.pipeline.validate_event import ValidateEvent
+from app.pipeline.validate_and_classify_event import ValidateAndClassifyEvent
 
 # from app.pipeline.extractors.update import UpdateEventExtractor
 # from app.pipeline.extractors.view import ViewEventExtractor
@@ -30,19 +29,13 @@ class CalendarPipeline(Pipeline):
 
     pipeline_schema = PipelineSchema(
         description="Pipeline for handling calendar operations",
-        start=ValidateEvent,
+        start=ValidateAndClassifyEvent,
         nodes=[
-            # Security and validation
+            # Security validation and intent classification, run concurrently
             NodeConfig(
-                node=ValidateEvent,
-                connections=[ClassifyEvent],
-                description="Validate input security and legitimacy",
-            ),
-            # Intent classification
-            NodeConfig(
-                node=ClassifyEvent,
+                node=ValidateAndClassifyEvent,
                 connections=[RouteEvent],
-                description="Classify the calendar operation intent",
+                description="Validate input legitimacy and classify the operation intent",
             ),
             # Event Routing
             NodeConfig(
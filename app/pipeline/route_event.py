@@ -26,7 +26,7 @@ class CreateEventRouter(RouterNode):
     """Routes create event to appropriate extractor"""
 
     def determine_next_node(self, task_context: TaskContext) -> type[Node] | None:
-        classification = task_context.nodes["ClassifyEvent"]["response_model"]
+        classification = task_context.nodes["ClassifyEvent"].response_model
         if classification.request_type == EventType.CREATE_EVENT:
             return CreateEventExtractor
         return None
@@ -36,7 +36,7 @@ class DeleteEventRouter(RouterNode):
     """Routes delete event to appropriate extractor"""
 
     def determine_next_node(self, task_context: TaskContext) -> type[Node] | None:
-        classification = task_context.nodes["ClassifyEvent"]["response_model"]
+        classification = task_context.nodes["ClassifyEvent"].response_model
         if classification.request_type == EventType.DELETE_EVENT:
             return LookupEventExtractor
         return None
@@ -0,0 +1,21 @@
+"""
+Validation and Classification Module
+
+Node group running event validation and classification concurrently in the pipeline.
+"""
+
+from app.core.pipeline import ParallelNodeGroup
+from app.pipeline.classify_event import ClassifyEvent
+from app.pipeline.validate_event import ValidateEvent
+
+
+class ValidateAndClassifyEvent(ParallelNodeGroup):
+    """Validates and classifies the event request concurrently.
+
+    Both nodes only read the request text, so their LLM calls overlap instead of
+    running back to back. A failed validation cancels the in-flight classification.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.nodes = [ValidateEvent, ClassifyEvent]  # classes not instantiated
@@ -5,6 +5,8 @@ Node for event request validation in the pipeline.
 Validates security and legitimacy of calendar requests.
 """
 
+import asyncio
+from contextlib import aclosing
 from typing import Any
 
 from app.core.exceptions import ErrorMessages, LLMServiceError, ValidationError
@@ -14,8 +16,30 @@ from app.llm.config import get_llm_config
 from app.llm.factory import LLMFactory
 from app.logging.factory import logger
 from app.pipeline.schema.validate import ValidateContext, ValidateResponse
+from app.services.exact_cache import get_exact_cache
 from app.services.prompt_loader import PromptManager
 
+# Shortest request that can name a calendar operation
+_MIN_REQUEST_CHARS = 3
+
+
+def _prefilter(request: str, max_chars: int) -> str | None:
+    """Reject requests that cannot be valid calendar requests without an LLM call.
+
+    Only checks that no legitimate request can fail: keyword or punctuation heuristics
+    would reject valid requests ("Lunch with Anna at noon", "Sync -- budget; room 4").
+
+    Returns the rejection reason, or None if the request needs LLM validation.
+    """
+    text = request.strip()
+    if len(text) < _MIN_REQUEST_CHARS:
+        return "request is too short to describe a calendar operation"
+    if len(text) > max_chars:
+        return f"request exceeds {max_chars} characters"
+    if not any(char.isalpha() for char in text):
+        return "request contains no words"
+    return None
+
 
 class ValidateEvent(Node):
     """Validates the event request for legitimacy and safety."""
@@ -24,48 +48,127 @@ class ValidateEvent(Node):
         """Initialize validator"""
         config = get_llm_config()
         self.confidence_threshold = config.confidence_threshold
+        self.escalation_threshold = config.validate_escalation_threshold
+        self.max_request_chars = config.validate_max_request_chars
         self.llm_provider = LLMFactory("openai")
+        self.fast_model = self.llm_provider.settings.fast_model
+        self.stream_enabled = config.validate_stream_enabled
+        self.cache = get_exact_cache(self.node_name, normalize_keys=False)
         logger.info("Initialized %s", self.node_name)
 
     def get_context(self, task_context: TaskContext) -> ValidateContext:
         """Extract context for validation"""
         return ValidateContext(request=task_context.event.request)
 
-    def create_completion(self, context: ValidateContext) -> tuple[ValidateResponse, Any]:
-        """Get validation results from LLM"""
+    async def acreate_completion(self, context: ValidateContext) -> tuple[ValidateResponse, Any]:
+        """Get validation results from cache or LLM.
+
+        The fast model answers first; a verdict below the escalation threshold is
+        re-issued against the default model, whose result is returned instead.
+        """
+        cached_model = self.cache.lookup(context.request)
+        if cached_model is not None:
+            logger.debug("Exact-match cache hit")
+            return cached_model, None
+
         prompt = PromptManager.get_prompt("validate_event_request")
-        response_model, completion = self.llm_provider.create_completion(
-            response_model=ValidateResponse,
-            messages=[
-                {
-                    "role": "system",
-                    "content": prompt,
-                },
-                {
-                    "role": "user",
-                    "content": context.request,
-                },
-            ],
+        messages = [
+            {
+                "role": "system",
+                "content": prompt,
+            },
+            {
+                "role": "user",
+                "content": context.request,
+            },
+        ]
+        response_model, completion = await self._acomplete(
+            messages, escalate=True, model=self.fast_model
         )
+
+        if self._should_escalate(response_model):
+            logger.debug(
+                "Escalating validation to default model (confidence: %.2f < %.2f)",
+                response_model.confidence_score,
+                self.escalation_threshold,
+            )
+            response_model, completion = await self._acomplete(messages, escalate=False)
+
+        # Only passing verdicts are reused; rejected requests are always re-checked
+        if self._is_valid(response_model):
+            self.cache.insert(context.request, response_model)
+
         return response_model, completion
 
+    async def _acomplete(
+        self, messages: list[dict[str, str]], escalate: bool, **kwargs: Any
+    ) -> tuple[ValidateResponse, Any]:
+        """Get a validation verdict from the LLM, streamed if enabled"""
+        if self.stream_enabled:
+            return await self._astream_validation(messages, escalate, **kwargs), None
+        return await self.llm_provider.acreate_completion(
+            response_model=ValidateResponse, messages=messages, **kwargs
+        )
+
+    async def _astream_validation(
+        self, messages: list[dict[str, str]], escalate: bool, **kwargs: Any
+    ) -> ValidateResponse:
+        """Stream the validation and return as soon as the verdict is final.
+
+        Fields are generated in schema order, so once reasoning starts the verdict fields
+        are complete. A passing verdict, or one that will be escalated, returns without
+        waiting for the reasoning; a rejection is read to the end, since its reasoning
+        becomes the error message.
+        """
+        partial = None
+        decided = False
+        stream = self.llm_provider.astream_completion(
+            messages=messages, response_model=ValidateResponse, **kwargs
+        )
+        async with aclosing(stream) as partials:
+            async for partial in partials:
+                verdict = (partial.is_safe, partial.is_valid, partial.confidence_score)
+                if decided or None in verdict or partial.reasoning is None:
+                    continue
+                decided = True
+                candidate = self._complete_response(partial)
+                if self._is_valid(candidate) or (escalate and self._should_escalate(candidate)):
+                    logger.debug("Validation decided before reasoning completed")
+                    return candidate
+
+        if partial is None:
+            raise ValueError("Empty validation stream")
+        return self._complete_response(partial)
+
+    @staticmethod
+    def _complete_response(partial: Any) -> ValidateResponse:
+        """Validate a streamed partial into a plain ValidateResponse"""
+        return ValidateResponse.model_validate(
+            {name: getattr(partial, name) for name in ValidateResponse.model_fields}
+        )
+
     def process(self, task_context: TaskContext) -> TaskContext:
-        """Process combined validation"""
+        """Process combined validation (sync entry point for the pipeline)"""
+        return asyncio.run(self.aprocess(task_context))
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        """Process combined validation without blocking the event loop"""
         context = self.get_context(task_context)
 
+        rejection = _prefilter(context.request, self.max_request_chars)
+        if rejection:
+            logger.info("Validation failed (prefilter: %s)", rejection)
+            raise ValidationError(ErrorMessages.validation_failed(rejection))
+
         try:
-            response_model, completion = self.create_completion(context)
+            response_model, completion = await self.acreate_completion(context)
         except Exception as llm_error:
             raise LLMServiceError(
                 ErrorMessages.llm_failed("validation", str(llm_error))
             ) from llm_error
 
         # Event validation logic
-        is_valid = (
-            response_model.is_safe
-            and response_model.is_valid
-            and response_model.confidence_score >= self.confidence_threshold
-        )
+        is_valid = self._is_valid(response_model)
 
         if not is_valid:
             raise ValidationError(ErrorMessages.validation_failed(response_model.reasoning))
@@ -74,13 +177,28 @@ class ValidateEvent(Node):
         task_context.update_node(
             self.node_name,
             response_model=response_model,
-            usage=completion.usage,
+            usage=completion.usage if completion else None,
         )
 
         self._log_validation_results(is_valid, response_model)
 
         return task_context
 
+    def _is_valid(self, response_model: ValidateResponse) -> bool:
+        """Whether the response confidently marks the request as safe and valid"""
+        return (
+            response_model.is_safe
+            and response_model.is_valid
+            and response_model.confidence_score >= self.confidence_threshold
+        )
+
+    def _should_escalate(self, response_model: ValidateResponse) -> bool:
+        """Whether a fast-model verdict is too unsure to keep"""
+        return (
+            response_model.confidence_score < self.escalation_threshold
+            and self.fast_model != self.llm_provider.settings.default_model
+        )
+
     def _log_validation_results(self, is_valid: bool, response_model: ValidateResponse):
         """Log validation results with summary and optional details"""
         if is_valid:
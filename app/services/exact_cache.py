@@ -0,0 +1,116 @@
+"""
+Exact-Match Cache Module
+
+This module provides an in-process LRU cache for LLM responses keyed on the
+normalized request text. It is the cheap first layer in front of the semantic cache:
+a hit costs a single dictionary lookup instead of an embedding or completion call.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from app.llm.config import get_llm_config
+from app.shared.text import normalize_request
+
+
+class ExactMatchCache:
+    """LRU cache for structured LLM responses keyed on normalized request text.
+
+    Keys are normalized with normalize_request(), so trivial variants of the same
+    request ("Show my calendar!", "show my  calendar") share an entry. When full,
+    the least recently used entry is evicted. A max_entries of 0 disables the cache.
+
+    Caches of extracted values should set normalize_keys=False: punctuation carries
+    meaning there ("jo.smith" vs "jo-smith", "9-11" vs "9:11"), so keys are only
+    stripped of surrounding whitespace.
+
+    Attributes:
+        max_entries: Maximum number of cached entries
+        normalize_keys: Whether keys are normalized with normalize_request()
+
+    Example:
+        cache = ExactMatchCache(max_entries=4096)
+        cache.insert("Show my calendar", response_model)
+        cached = cache.lookup("show my calendar")  # response_model
+    """
+
+    def __init__(self, max_entries: int = 4096, normalize_keys: bool = True):
+        """
+        Initialize the exact-match cache.
+
+        Args:
+            max_entries: Maximum number of cached entries
+            normalize_keys: Whether keys are normalized with normalize_request()
+        """
+        self.max_entries = max_entries
+        self.normalize_keys = normalize_keys
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def normalize(self, request: str) -> str:
+        """Normalize request text into a cache key."""
+        return normalize_request(request) if self.normalize_keys else request.strip()
+
+    def lookup(self, request: str) -> Any | None:
+        """
+        Return the cached value for the request, if present.
+
+        Args:
+            request: Raw request text
+
+        Returns:
+            Cached value or None
+        """
+        key = self.normalize(request)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def insert(self, request: str, value: Any) -> None:
+        """
+        Add an entry to the cache, evicting the least recently used entry when full.
+
+        Args:
+            request: Raw request text
+            value: Response to cache for the request
+        """
+        if self.max_entries <= 0:
+            return
+
+        key = self.normalize(request)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache
+def get_exact_cache(name: str, normalize_keys: bool = True) -> ExactMatchCache:
+    """
+    Get the process-wide exact-match cache for a named node. Uses lru_cache so that
+    every node instance in the process shares the same cache.
+
+    Args:
+        name: Cache name
+        normalize_keys: Whether keys are normalized with normalize_request()
+
+    Returns:
+        ExactMatchCache: The shared exact-match cache.
+    """
+    config = get_llm_config()
+    return ExactMatchCache(
+        max_entries=config.exact_cache_max_entries, normalize_keys=normalize_keys
+    )
@@ -6,6 +6,7 @@ It uses Jinja2 for template rendering and python-frontmatter for metadata handli
 implementing a singleton pattern for template environment management.
 """
 
+from functools import cache, lru_cache
 from pathlib import Path
 
 import frontmatter
@@ -13,6 +14,7 @@ from jinja2 import (
     Environment,
     FileSystemLoader,
     StrictUndefined,
+    Template,
     TemplateError,
     TemplateNotFound,
     meta,
@@ -65,9 +67,11 @@ class PromptManager:
         return cls._env
 
     @staticmethod
+    @cache
     def _load_template_file(template: str):
         """
         Internal utility to resolve and load a template file with frontmatter.
+        Cached so each template file is read and parsed once per process.
 
         Returns:
             A tuple containing the frontmatter.Post object and the Jinja2 Environment.
@@ -95,13 +99,44 @@ class PromptManager:
 
         return post, env
 
+    @staticmethod
+    @cache
+    def _compile_template(template: str) -> Template:
+        """
+        Internal utility to compile a template's content once per process.
+
+        Returns:
+            Compiled Jinja2 Template for the content after frontmatter processing.
+        Raises:
+            FileNotFoundError: If the template file cannot be found.
+        """
+        post, env = PromptManager._load_template_file(template)
+        return env.from_string(post.content)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _render_template(template: str, variables: tuple[tuple[str, object], ...]) -> str:
+        """
+        Internal utility to render a compiled template. Cached per template name and
+        variables, so static prompts render once per process.
+
+        Raises:
+            ValueError: If template rendering fails
+            FileNotFoundError: If template file doesn't exist
+        """
+        template_obj = PromptManager._compile_template(template)
+        try:
+            return template_obj.render(**dict(variables))
+        except TemplateError as e:
+            raise ValueError(f"Error rendering template: {str(e)}") from e
+
     @staticmethod
     def get_prompt(template: str, **kwargs) -> str:
         """Loads and renders a prompt template with provided variables.
 
         Args:
             template: Name of the template file (without .j2 extension)
-            **kwargs: Variables to use in template rendering
+            **kwargs: Variables to use in template rendering (must be hashable)
 
         Returns:
             Rendered template string
@@ -110,14 +145,7 @@ class PromptManager:
             ValueError: If template rendering fails
             FileNotFoundError: If template file doesn't exist
         """
-        post, env = PromptManager._load_template_file(template)
-
-        # Create a new template object from the content string after frontmatter processing
-        template_obj = env.from_string(post.content)
-        try:
-            return template_obj.render(**kwargs)
-        except TemplateError as e:
-            raise ValueError(f"Error rendering template: {str(e)}") from e
+        return PromptManager._render_template(template, tuple(sorted(kwargs.items())))
 
     @staticmethod
     def get_template_info(template: str) -> dict:
@@ -0,0 +1,253 @@
+"""
+Semantic Cache Module
+
+This module provides an in-process semantic cache for LLM responses.
+Entries are keyed by L2-normalized embeddings of the user request; a lookup returns
+the stored response of the most similar cached request when the cosine similarity
+clears the configured threshold. Similarity search is a single vectorized matrix product.
+"""
+
+import atexit
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.llm.config import get_llm_config
+from app.logging.factory import logger
+
+
+class SemanticCache:
+    """Embedding-similarity cache for structured LLM responses.
+
+    The cache keeps a preallocated max_entries x dim ring buffer of normalized embeddings
+    and a parallel list of cached response models. Lookups compute cosine similarity
+    against all keys at once and return the value of the best match above the threshold.
+    When full, an insert overwrites the oldest entry in place.
+
+    Persisted caches store the keys with np.save() and the values as JSON lines, so
+    loading a cache file never executes code (unlike pickle). Inserts never write to
+    disk: save() is called every save_interval inserts, off the event loop, and at exit.
+
+    Attributes:
+        model: Response model class of the cached values
+        threshold: Minimum cosine similarity for a cache hit
+        max_entries: Maximum number of cached entries
+        path: Optional base path (without suffix) used to persist the cache across restarts
+        save_interval: Number of unsaved inserts after which save_due becomes True
+
+    Example:
+        cache = SemanticCache(ClassifyResponse, threshold=0.92)
+        cache.insert(embedding, response_model)
+        cached = cache.lookup(embedding)  # response_model or None
+    """
+
+    def __init__(
+        self,
+        model: type[BaseModel],
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        path: Path | None = None,
+        save_interval: int = 32,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            model: Response model class of the cached values
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached entries
+            path: Optional base path for warm starts. Loaded if its files exist.
+            save_interval: Number of unsaved inserts after which save_due becomes True
+        """
+        self.model = model
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.path = path
+        self.save_interval = save_interval
+        self._keys: np.ndarray | None = None  # max_entries x dim ring buffer
+        self._values: list[BaseModel | None] = []
+        self._size = 0
+        self._next = 0  # Slot overwritten by the next insert
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+        if self.path:
+            self._load()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def save_due(self) -> bool:
+        """Whether enough inserts are unsaved that the cache should be persisted."""
+        return self.path is not None and self._unsaved >= self.save_interval
+
+    @staticmethod
+    def _normalize(embedding: list[float] | np.ndarray) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: list[float] | np.ndarray) -> Any | None:
+        """
+        Return the cached value of the most similar entry.
+
+        Args:
+            embedding: Embedding of the incoming request
+
+        Returns:
+            Cached value if the best similarity reaches the threshold, None otherwise
+        """
+        query = self._normalize(embedding)
+        with self._lock:
+            if not self._size or self._keys is None or self._keys.shape[1] != query.shape[0]:
+                return None
+
+            similarities = self._keys[: self._size] @ query
+            best = int(np.argmax(similarities))
+            score = float(similarities[best])
+            if score < self.threshold:
+                return None
+
+            logger.debug("Semantic cache hit (similarity: %.3f)", score)
+            return self._values[best]
+
+    def insert(self, embedding: list[float] | np.ndarray, value: BaseModel) -> None:
+        """
+        Add an entry to the cache, evicting the oldest entry when full.
+
+        Args:
+            embedding: Embedding of the request
+            value: Response to cache for similar requests
+        """
+        if self.max_entries <= 0:
+            return
+
+        key = self._normalize(embedding)
+        with self._lock:
+            if self._keys is None or self._keys.shape[1] != key.shape[0]:
+                self._allocate(key.shape[0])
+            self._keys[self._next] = key  # type: ignore
+            self._values[self._next] = value
+            self._next = (self._next + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
+            self._unsaved += 1
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._keys = None
+            self._values = []
+            self._size = self._next = 0
+
+    def save(self) -> None:
+        """
+        Persist unsaved entries to the key and value files.
+
+        Blocks on disk I/O, so async callers run it in a worker thread. Entries are
+        snapshotted under the lock and written outside it, so lookups and inserts
+        are not held up by the write.
+        """
+        if not self.path:
+            return
+
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved or self._keys is None:
+                    return
+                # Oldest entry first, so that a reload evicts in the same order
+                order = (self._next - self._size + np.arange(self._size)) % self.max_entries
+                keys = self._keys[order]
+                values = [self._values[i] for i in order]
+                self._unsaved = 0
+            self._write(keys, values)
+
+    def _allocate(self, dim: int) -> None:
+        """Allocate an empty ring buffer for embeddings of the given dimension."""
+        self._keys = np.zeros((self.max_entries, dim), dtype=np.float32)
+        self._values = [None] * self.max_entries
+        self._size = self._next = 0
+
+    @property
+    def _keys_path(self) -> Path:
+        assert self.path is not None
+        return self.path.with_suffix(".npy")
+
+    @property
+    def _values_path(self) -> Path:
+        assert self.path is not None
+        return self.path.with_suffix(".jsonl")
+
+    def _load(self) -> None:
+        """Load cached entries from the key and value files, if present."""
+        if not self._keys_path.exists() or not self._values_path.exists():
+            return
+
+        try:
+            keys = np.load(self._keys_path, allow_pickle=False)
+            with open(self._values_path, encoding="utf-8") as file:
+                values = [self.model.model_validate_json(line) for line in file if line.strip()]
+            if keys.ndim != 2 or len(keys) != len(values):  # noqa: PLR2004 - key matrix
+                raise ValueError("key and value files do not match")
+        except Exception as e:
+            logger.warning("Failed to load semantic cache from %s: %s", self.path, e)
+            return
+
+        if self.max_entries <= 0 or not values:
+            return
+
+        # Keep the newest entries if the cache was saved with a larger max_entries
+        keys, values = keys[-self.max_entries :], values[-self.max_entries :]
+        self._allocate(keys.shape[1])
+        self._keys[: len(values)] = keys  # type: ignore
+        self._values[: len(values)] = values
+        self._size = len(values)
+        self._next = self._size % self.max_entries
+        logger.debug("Loaded %d semantic cache entries from %s", self._size, self.path)
+
+    def _write(self, keys: np.ndarray, values: list[Any]) -> None:
+        """Atomically write entries to the key and value files."""
+        try:
+            self._keys_path.parent.mkdir(parents=True, exist_ok=True)
+            keys_temp = self._keys_path.with_suffix(".npy.tmp")
+            with open(keys_temp, "wb") as file:
+                np.save(file, keys, allow_pickle=False)
+            values_temp = self._values_path.with_suffix(".jsonl.tmp")
+            with open(values_temp, "w", encoding="utf-8") as file:
+                file.writelines(f"{value.model_dump_json()}\n" for value in values)
+            keys_temp.replace(self._keys_path)
+            values_temp.replace(self._values_path)
+        except Exception as e:
+            logger.warning("Failed to save semantic cache to %s: %s", self.path, e)
+
+
+@lru_cache
+def get_semantic_cache(name: str, model: type[BaseModel]) -> SemanticCache:
+    """
+    Get the process-wide semantic cache for a named node. Uses lru_cache so that
+    every node instance in the process shares the same cache.
+
+    Args:
+        name: Cache name, used as the persistence file name
+        model: Response model class of the cached values
+
+    Returns:
+        SemanticCache: The shared semantic cache.
+    """
+    config = get_llm_config()
+    path = config.semantic_cache_dir / name if config.semantic_cache_dir else None
+    cache = SemanticCache(
+        model,
+        threshold=config.semantic_cache_threshold,
+        max_entries=config.semantic_cache_max_entries,
+        path=path,
+    )
+    if path:
+        atexit.register(cache.save)  # Persist the entries inserted since the last save
+    return cache
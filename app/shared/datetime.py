@@ -15,6 +15,8 @@ def get_datetime_reference() -> EventDateTime:
     """
     Get current datetime as reference point for LLM.
     Utilizes the configured user timezone for accurate event scheduling.
+    Truncated to the minute: calendar times need no seconds, and the reference
+    message then stays identical for every request within the same minute.
 
     Returns:
         EventDateTime: Current datetime in user timezone
@@ -25,6 +27,21 @@ def get_datetime_reference() -> EventDateTime:
     tz = ZoneInfo(user_tz)
 
     current = datetime.now(tz)
-    current_iso = current.replace(microsecond=0).isoformat()
+    current_iso = current.replace(second=0, microsecond=0).isoformat()
 
-    return EventDateTime(dateTime=current_iso, timeZone=user_tz)
+    # Built from the validated config timezone - skip RFC3339/IANA/offset re-validation
+    return EventDateTime.model_construct(dateTime=current_iso, timeZone=user_tz)
+
+
+def format_datetime_reference(datetime_ref: EventDateTime) -> str:
+    """
+    Format the datetime reference as a short message for the LLM.
+    Sent apart from the static system prompt so that the prompt prefix stays cacheable.
+
+    Args:
+        datetime_ref: Current datetime reference
+
+    Returns:
+        str: Current datetime and system timezone lines
+    """
+    return f"Current datetime: {datetime_ref.dateTime}\nSystem timezone: {datetime_ref.timeZone}"
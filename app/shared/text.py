@@ -0,0 +1,66 @@
+"""
+Text Utility Module
+
+Provides request text normalization shared by the keyword fast path and response caches.
+"""
+
+import re
+import string
+
+# Lowercase ASCII letters and blank out punctuation in a single str.translate() pass.
+# Question marks and apostrophes are kept, they carry intent ("should I?", "don't");
+# typographic apostrophes (as typed on phones) are folded into the ASCII one.
+_NORMALIZE_TABLE = str.maketrans(
+    {c: " " for c in string.punctuation if c not in "?'"}
+    | {c: c.lower() for c in string.ascii_uppercase}
+    | {"\u2019": "'", "\u2018": "'"}
+)
+
+# Spelled-out quantities as in "in two hours" or "in forty-five minutes"
+_NUMBER_WORD = (
+    r"(?:one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|fifteen|"
+    r"twenty|thirty|forty|fifty|sixty|ninety)"
+)
+
+# Times relative to the current clock time rather than to the current date
+_CLOCK_RELATIVE_RE = re.compile(
+    r"\b(?:now|right away|asap|immediately|later|upcoming|"
+    r"(?:next|last|previous) (?:meeting|event|appointment|call|session)s?|"
+    r"in (?:an?|\d+(?:\.\d+)?|a few|a couple(?: of)?|half an|"
+    rf"{_NUMBER_WORD}(?:[- ]{_NUMBER_WORD})?)"
+    r"(?: and a half)? (?:min|mins|minutes?|hours?|hrs?))\b",
+    re.IGNORECASE,
+)
+
+
+def normalize_request(request: str) -> str:
+    """
+    Normalize request text for keyword matching and cache keys.
+
+    Lowercases ASCII letters, replaces punctuation with spaces and collapses whitespace,
+    so "Cancel my 3pm call-off!" and "cancel my 3pm call off" normalize identically.
+
+    Args:
+        request: Raw request text
+
+    Returns:
+        Normalized request text
+    """
+    return " ".join(request.translate(_NORMALIZE_TABLE).split())
+
+
+def is_clock_relative(request: str) -> bool:
+    """
+    Check whether a request refers to a time relative to the current clock time.
+
+    Relative dates ("tomorrow at 3pm", "next Friday") resolve the same way throughout a
+    day; "in 30 minutes" or "my next meeting" do not, so their extractions cannot be
+    reused from a response cache.
+
+    Args:
+        request: Raw request text
+
+    Returns:
+        True if the request depends on the clock time
+    """
+    return _CLOCK_RELATIVE_RE.search(request) is not None
@@ -5,8 +5,13 @@ This script sets up logging for Celery workers and imports the celery app.
 Use this as the entry point for celery workers.
 """
 
+import threading
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from app.calendar.auth import get_google_auth_client
 from app.logging.config import WORKER
-from app.logging.factory import logger, setup_service_logger
+from app.logging.factory import logger, setup_service_logger, stop_log_listener
 from app.worker.celery_app import celery_app
 
 # Setup logging for Celery worker (pure configuration)
@@ -15,4 +20,24 @@ setup_service_logger(WORKER)
 # Celery celery application instance
 app = celery_app
 
+
+@worker_process_init.connect
+def prewarm_worker_process(**_kwargs) -> None:
+    """Authenticate with Google when a worker process starts, not on its first task.
+
+    Runs in a background thread so that a slow token refresh cannot exceed Celery's
+    process start timeout; a task arriving meanwhile waits on the auth client's lock.
+    """
+    threading.Thread(target=get_google_auth_client().prewarm, daemon=True).start()
+
+
+@worker_process_shutdown.connect
+def flush_worker_process_logs(**_kwargs) -> None:
+    """Write out queued log records before a worker process exits.
+
+    Prefork children exit via os._exit(), which skips the atexit flush.
+    """
+    stop_log_listener()
+
+
 logger.info("Celery worker initialized")
@@ -0,0 +1,14 @@
+"""Shared test configuration.
+
+Settings are read from the environment when the app modules are first used, so
+placeholder values for the required keys are set before any test imports them.
+"""
+
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+os.environ.setdefault("DATABASE_HOST", "localhost")
+os.environ.setdefault("DATABASE_USER", "test")
+os.environ.setdefault("DATABASE_PASSWORD", "test")
+os.environ.setdefault("LOG_FILE_OUTPUT", "false")
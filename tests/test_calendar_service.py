@@ -0,0 +1,115 @@
+"""Tests for batched event deletion in the Google Calendar service."""
+
+from unittest.mock import MagicMock, patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from app.calendar.schema import GoogleDateTime, GoogleEventResponse
+from app.calendar.service import BATCH_MAX_REQUESTS, GoogleCalendarService
+
+
+def _event(event_id: str) -> GoogleEventResponse:
+    return GoogleEventResponse(
+        id=event_id,
+        summary=f"Event {event_id}",
+        start=GoogleDateTime(date="2025-06-02"),
+        end=GoogleDateTime(date="2025-06-03"),
+        htmlLink=f"https://calendar.google.com/event?eid={event_id}",
+    )
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"")
+
+
+class FakeBatch:
+    """Batch request that answers each delete with the outcome configured for its event."""
+
+    def __init__(self, callback, outcomes):
+        self.callback = callback
+        self.outcomes = outcomes
+        self.requests: list[tuple[str, str]] = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, event_id in self.requests:
+            self.callback(request_id, None, self.outcomes.get(event_id))
+
+
+@pytest.fixture
+def calendar():
+    """Calendar service over a mocked API whose delete requests resolve to their event ID."""
+    service = MagicMock()
+    service.events.return_value.delete.side_effect = lambda **kwargs: kwargs["eventId"]
+    calendar_service = GoogleCalendarService(service)
+    calendar_service.outcomes = {}
+    calendar_service.batches = []
+
+    def new_batch_http_request(callback):
+        batch = FakeBatch(callback, calendar_service.outcomes)
+        calendar_service.batches.append(batch)
+        return batch
+
+    service.new_batch_http_request.side_effect = new_batch_http_request
+    return calendar_service
+
+
+def test_events_are_chunked_into_batches(calendar):
+    events = [_event(f"e{i}") for i in range(2 * BATCH_MAX_REQUESTS + 20)]
+
+    deleted = calendar.batch_delete_events("primary", events)
+
+    assert [len(batch.requests) for batch in calendar.batches] == [50, 50, 20]
+    assert [event.id for event in deleted] == [event.id for event in events]
+
+
+def test_request_ids_map_back_to_their_events(calendar):
+    events = [_event(f"e{i}") for i in range(BATCH_MAX_REQUESTS + 5)]
+
+    calendar.batch_delete_events("primary", events)
+
+    for batch in calendar.batches:
+        for request_id, event_id in batch.requests:
+            assert events[int(request_id)].id == event_id
+
+
+def test_missing_events_count_as_deleted(calendar):
+    calendar.outcomes = {"e1": _http_error(404)}
+
+    deleted = calendar.batch_delete_events("primary", [_event("e0"), _event("e1")])
+
+    assert [event.id for event in deleted] == ["e0", "e1"]
+
+
+def test_partial_failure_raises_after_the_batch_and_logs_deleted_events(calendar):
+    calendar.outcomes = {"e1": _http_error(500)}
+    events = [_event("e0"), _event("e1"), _event("e2")]
+
+    with patch("app.calendar.service.logger") as logger, pytest.raises(HttpError):
+        calendar.batch_delete_events("primary", events)
+
+    assert len(calendar.batches[0].requests) == 3
+    logger.error.assert_called_with(
+        "Deleted %d of %d events before the failure: %s", 2, 3, "e0, e2"
+    )
+
+
+def test_single_event_skips_the_batch(calendar):
+    delete = calendar.service.events.return_value.delete
+    delete.side_effect = None
+
+    deleted = calendar.batch_delete_events("primary", [_event("e0")])
+
+    assert [event.id for event in deleted] == ["e0"]
+    assert calendar.batches == []
+    delete.assert_called_once_with(calendarId="primary", eventId="e0")
+    delete.return_value.execute.assert_called_once_with()
+
+
+def test_missing_calendar_id_is_rejected(calendar):
+    with pytest.raises(ValueError):
+        calendar.batch_delete_events("", [_event("e0")])
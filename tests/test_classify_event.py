@@ -0,0 +1,46 @@
+"""Tests for the keyword fast path of the intent classifier."""
+
+import pytest
+
+from app.core.schema.event import EventType
+from app.pipeline.classify_event import _fast_classify
+
+
+@pytest.mark.parametrize(
+    "request_text",
+    [
+        "Schedule a meeting with Anna tomorrow at 3pm",
+        "Book a call with the design team on Friday",
+        "Set up the roadmap sync next Monday at 10am",
+    ],
+)
+def test_unambiguous_create_is_answered_locally(request_text):
+    response = _fast_classify(request_text)
+
+    assert response is not None
+    assert response.request_type == EventType.CREATE_EVENT
+    assert response.is_bulk_operation is False
+
+
+@pytest.mark.parametrize(
+    "request_text",
+    [
+        # Deletes always go to the LLM, "all" in a title is not a bulk marker
+        "Cancel the all-hands meeting tomorrow",
+        "Delete the All Hands sync on Friday",
+        "Delete all my meetings on Friday",
+        # Negated or deferred intents
+        "Don’t cancel the 3pm meeting",
+        "Don't schedule anything on Friday",
+        "No need to cancel the standup anymore",
+        "Remind me to cancel my gym membership",
+        "Remind me to book a dentist appointment",
+        # Questions and mixed intents
+        "Did I schedule lunch with Anna tomorrow",
+        "Can I book the room for Friday?",
+        "Cancel the standup and schedule a retro instead",
+        "Reschedule the roadmap sync to Monday",
+    ],
+)
+def test_ambiguous_or_destructive_requests_fall_through(request_text):
+    assert _fast_classify(request_text) is None
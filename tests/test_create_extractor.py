@@ -0,0 +1,111 @@
+"""Tests for clock-relative detection, the create extraction cache and streaming."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.api.schema import EventSchema
+from app.core.schema.task import TaskContext
+from app.pipeline.event.create.extractor import STREAMED_REASONING, CreateEventExtractor
+from app.pipeline.schema.create import CreateResponse
+from app.shared.text import is_clock_relative
+
+
+@pytest.mark.parametrize(
+    "request_text",
+    [
+        "Block an hour for focus time now",
+        "Set up a call with Anna right away",
+        "Schedule a sync asap",
+        "Lunch with Anna in an hour",
+        "Meeting with Anna in 2 hours",
+        "Meeting with Anna in 1.5 hours",
+        "Call the bank in half an hour",
+        "Call the bank in 30 mins",
+        "Dentist in two hours",
+        "Standup in Forty-Five minutes",
+        "Review in twenty five minutes",
+        "Review in two and a half hours",
+        "Review in a couple hours",
+        "Review in a few minutes",
+        "Move my next meeting to Friday",
+        "Cancel my previous appointment",
+    ],
+)
+def test_clock_relative_requests_are_detected(request_text):
+    assert is_clock_relative(request_text)
+
+
+@pytest.mark.parametrize(
+    "request_text",
+    [
+        "Lunch with Anna tomorrow at noon",
+        "Dinner with Anna tonight at 8",  # Same evening whenever it is asked that day
+        "Dentist next Friday at 9am",
+        "Team offsite in two weeks",
+        "Workshop in room 4 hours 9-11",
+        "Schedule the hour review on Monday",
+    ],
+)
+def test_date_relative_requests_are_not_clock_relative(request_text):
+    assert not is_clock_relative(request_text)
+
+
+@pytest.fixture
+def extractor():
+    node = CreateEventExtractor()
+    node.cache.clear()
+    node.auth_client = Mock()
+    response_model = CreateResponse.model_construct(
+        summary="Meeting with Anna", parsing_issues=[], reasoning="test extraction"
+    )
+    node.acreate_completion = AsyncMock(return_value=(response_model, None))
+    yield node
+    node.cache.clear()
+
+
+def _extract(node: CreateEventExtractor, request: str) -> None:
+    asyncio.run(node.aprocess(TaskContext(event=EventSchema(request=request))))
+
+
+def test_repeated_request_is_served_from_cache(extractor):
+    _extract(extractor, "Lunch with Anna tomorrow at noon")
+    _extract(extractor, "Lunch with Anna tomorrow at noon")
+
+    assert extractor.acreate_completion.await_count == 1
+
+
+def test_clock_relative_request_is_never_served_from_cache(extractor):
+    _extract(extractor, "Meeting with Anna in two hours")
+    _extract(extractor, "Meeting with Anna in two hours")
+
+    assert extractor.acreate_completion.await_count == 2
+    assert len(extractor.cache) == 0
+
+
+def _partial(reasoning: str | None) -> SimpleNamespace:
+    fields = dict.fromkeys(CreateResponse.model_fields)
+    start = {"dateTime": "2025-06-02T12:00:00", "timeZone": "Europe/Berlin"}
+    end = {"dateTime": "2025-06-02T13:00:00", "timeZone": "Europe/Berlin"}
+    fields.update(summary="Lunch with Anna", start=start, end=end, attendees=(), parsing_issues=[])
+    fields.update(reasoning=reasoning)
+    return SimpleNamespace(**fields)
+
+
+def _stream_extraction(partials: list[SimpleNamespace]) -> CreateResponse | None:
+    async def stream(**kwargs):
+        for partial in partials:
+            yield partial
+
+    node = CreateEventExtractor()
+    node.llm_provider = Mock(astream_completion=Mock(side_effect=stream))
+    return asyncio.run(node._astream_extraction(messages=[]))
+
+
+def test_streamed_extraction_does_not_keep_partial_reasoning():
+    response = _stream_extraction([_partial(None), _partial("Lunch is"), _partial("Lunch is at")])
+
+    assert response.summary == "Lunch with Anna"
+    assert response.reasoning == STREAMED_REASONING
@@ -0,0 +1,64 @@
+"""Tests for event datetime validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.schema.event import AllDayEventDate, EventDateTime
+from app.pipeline.schema.create import CreateResponse
+
+
+@pytest.mark.parametrize(
+    ("naive", "timezone", "expected"),
+    [
+        ("2025-06-02T09:00:00", "Europe/Berlin", "2025-06-02T09:00:00+02:00"),
+        ("2025-01-15T09:00:00", "Europe/Berlin", "2025-01-15T09:00:00+01:00"),
+        ("2025-06-02T09:30", "America/New_York", "2025-06-02T09:30:00-04:00"),
+        ("2025-06-02T09:00:00", "UTC", "2025-06-02T09:00:00+00:00"),
+    ],
+)
+def test_naive_datetime_gets_the_zone_offset(naive, timezone, expected):
+    event_time = EventDateTime(dateTime=naive, timeZone=timezone)
+
+    assert event_time.dateTime == expected
+
+
+def test_matching_explicit_offset_is_kept():
+    event_time = EventDateTime(dateTime="2025-06-02T09:00:00+02:00", timeZone="Europe/Berlin")
+
+    assert event_time.dateTime == "2025-06-02T09:00:00+02:00"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-06-02T09:00:00+05:00",
+        "2025-06-02T09:00:00Z",
+        "2025-01-15T09:00:00+02:00",  # Summer offset in winter
+    ],
+)
+def test_mismatched_explicit_offset_is_rejected(value):
+    with pytest.raises(ValidationError, match="does not match"):
+        EventDateTime(dateTime=value, timeZone="Europe/Berlin")
+
+
+def test_invalid_naive_values_are_still_rejected():
+    with pytest.raises(ValidationError):
+        EventDateTime(dateTime="tomorrow at 9", timeZone="Europe/Berlin")
+    with pytest.raises(ValidationError):
+        EventDateTime(dateTime="2025-06-02T09:00:00", timeZone="Mars/Olympus")
+
+
+def test_all_day_dates_are_untouched():
+    response = CreateResponse.model_validate(
+        {
+            "summary": "Offsite",
+            "start": {"date": "2025-06-02"},
+            "end": {"date": "2025-06-03"},
+            "description": None,
+            "location": None,
+            "reasoning": "all-day event",
+        }
+    )
+
+    assert response.start == AllDayEventDate(date="2025-06-02")
+    assert response.end == AllDayEventDate(date="2025-06-03")
@@ -0,0 +1,49 @@
+"""Tests for the event ID fast path of the lookup extractor."""
+
+import pytest
+
+from app.pipeline.event.lookup.extractor import _match_event_id
+
+
+@pytest.mark.parametrize(
+    ("request_text", "event_id"),
+    [
+        ("Delete event 4k8n2q1v9d0s7a3b5c6e8f0g1h", "4k8n2q1v9d0s7a3b5c6e8f0g1h"),
+        ("show me abc123def456ghi789jkl0mn please", "abc123def456ghi789jkl0mn"),
+        ("Cancel 7hq3k1m2n4p5r6s8t9u0v1a2b3_20250602", "7hq3k1m2n4p5r6s8t9u0v1a2b3_20250602"),
+        (
+            "Cancel 7hq3k1m2n4p5r6s8t9u0v1a2b3_20250602T090000Z only",
+            "7hq3k1m2n4p5r6s8t9u0v1a2b3_20250602T090000Z",
+        ),
+        # The same ID twice is still a single event
+        (
+            "Delete 4k8n2q1v9d0s7a3b5c6e8f0g1h (id 4k8n2q1v9d0s7a3b5c6e8f0g1h)",
+            "4k8n2q1v9d0s7a3b5c6e8f0g1h",
+        ),
+    ],
+)
+def test_explicit_event_id_skips_the_llm(request_text, event_id):
+    response = _match_event_id(request_text)
+
+    assert response is not None
+    assert response.event_id == event_id
+    assert response.time_window is None
+
+
+@pytest.mark.parametrize(
+    "request_text",
+    [
+        "Show my meetings tomorrow",
+        "Delete the internationalization review",  # Long word without digits
+        "Cancel the standup on 2025-06-02",
+        "Show events between 20250602 and 20250609",
+        "Call 12345678901234567890 about the contract",  # Digits only
+        "Delete my 3pm meeting with jo.smith@example.com",
+        "Show the Q3 roadmap sync at 10am",
+        "Move abc123 to Friday",  # Too short for an event ID
+        # More than one ID goes to the LLM
+        "Delete 4k8n2q1v9d0s7a3b5c6e8f0g1h and abc123def456ghi789jkl0mn",
+    ],
+)
+def test_plain_words_and_dates_are_not_event_ids(request_text):
+    assert _match_event_id(request_text) is None
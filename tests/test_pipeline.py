@@ -0,0 +1,103 @@
+"""Tests for concurrent node groups in the pipeline."""
+
+import asyncio
+
+import pytest
+
+from app.api.schema import EventSchema
+from app.core.exceptions import ValidationError
+from app.core.node import Node
+from app.core.pipeline import ParallelNodeGroup, Pipeline
+from app.core.schema.pipeline import NodeConfig, PipelineSchema
+from app.core.schema.task import TaskContext
+from app.pipeline.classify_event import ClassifyEvent
+from app.pipeline.validate_and_classify_event import ValidateAndClassifyEvent
+from app.pipeline.validate_event import ValidateEvent
+
+events: list[str] = []
+
+
+class FakeNode(Node):
+    """Async node that stores its name as its result after a short delay."""
+
+    delay = 0.01
+
+    def process(self, task_context: TaskContext) -> TaskContext:
+        raise NotImplementedError
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        await asyncio.sleep(self.delay)
+        task_context.update_node(self.node_name, response_model=self.node_name)
+        events.append(f"{self.node_name} done")
+        return task_context
+
+
+class PassingValidation(FakeNode):
+    pass
+
+
+class FailingValidation(FakeNode):
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        await asyncio.sleep(self.delay)
+        raise ValidationError("request rejected")
+
+
+class SlowClassification(FakeNode):
+    delay = 0.05
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        try:
+            return await super().aprocess(task_context)
+        except asyncio.CancelledError:
+            events.append(f"{self.node_name} cancelled")
+            raise
+
+
+class NextNode(FakeNode):
+    pass
+
+
+class PassingGroup(ParallelNodeGroup):
+    def __init__(self):
+        super().__init__()
+        self.nodes = [PassingValidation, SlowClassification]
+
+
+class FailingGroup(ParallelNodeGroup):
+    def __init__(self):
+        super().__init__()
+        self.nodes = [FailingValidation, SlowClassification]
+
+
+def _pipeline(group: type[ParallelNodeGroup]) -> Pipeline:
+    class GroupPipeline(Pipeline):
+        pipeline_schema = PipelineSchema(
+            start=group,
+            nodes=[NodeConfig(node=group, connections=[NextNode])],
+        )
+
+    return GroupPipeline()
+
+
+@pytest.fixture(autouse=True)
+def clear_events():
+    events.clear()
+
+
+def test_group_merges_every_member_result():
+    task_context = asyncio.run(_pipeline(PassingGroup).arun(EventSchema(request="test")))
+
+    assert task_context.nodes["PassingValidation"].response_model == "PassingValidation"
+    assert task_context.nodes["SlowClassification"].response_model == "SlowClassification"
+    assert task_context.nodes["NextNode"].response_model == "NextNode"
+
+
+def test_failed_validation_cancels_classification_and_stops_the_pipeline():
+    with pytest.raises(ValidationError, match="request rejected"):
+        asyncio.run(_pipeline(FailingGroup).arun(EventSchema(request="test")))
+
+    assert events == ["SlowClassification cancelled"]
+
+
+def test_validation_runs_first_so_its_error_takes_precedence():
+    assert ValidateAndClassifyEvent().nodes == [ValidateEvent, ClassifyEvent]
@@ -0,0 +1,57 @@
+"""Tests for the embedding-similarity response cache."""
+
+from app.core.schema.event import EventType
+from app.pipeline.schema.classify import ClassifyResponse
+from app.services.semantic_cache import SemanticCache
+
+
+def _response(reasoning: str) -> ClassifyResponse:
+    return ClassifyResponse(
+        has_intent=True,
+        request_type=EventType.VIEW_EVENT,
+        is_bulk_operation=False,
+        confidence_score=0.9,
+        reasoning=reasoning,
+    )
+
+
+def test_full_cache_overwrites_the_oldest_entry():
+    cache = SemanticCache(ClassifyResponse, max_entries=2)
+    cache.insert([1, 0, 0], _response("a"))
+    cache.insert([0, 1, 0], _response("b"))
+    cache.insert([0, 0, 1], _response("c"))
+
+    assert len(cache) == 2
+    assert cache.lookup([1, 0, 0]) is None
+    assert cache.lookup([0, 1, 0]).reasoning == "b"
+    assert cache.lookup([0, 0, 1]).reasoning == "c"
+
+
+def test_dissimilar_request_misses():
+    cache = SemanticCache(ClassifyResponse, threshold=0.9)
+    cache.insert([1, 0], _response("a"))
+
+    assert cache.lookup([1, 1]) is None
+
+
+def test_inserts_are_saved_only_when_requested(tmp_path):
+    path = tmp_path / "ClassifyEvent"
+    cache = SemanticCache(ClassifyResponse, max_entries=2, path=path, save_interval=2)
+    cache.insert([1, 0, 0], _response("a"))
+
+    assert not cache.save_due
+    assert not path.with_suffix(".npy").exists()
+
+    cache.insert([0, 1, 0], _response("b"))
+    cache.insert([0, 0, 1], _response("c"))
+    assert cache.save_due
+    cache.save()
+
+    reloaded = SemanticCache(ClassifyResponse, max_entries=2, path=path)
+    assert len(reloaded) == 2
+    assert reloaded.lookup([0, 1, 0]).reasoning == "b"
+
+    # Eviction order survives the reload
+    reloaded.insert([1, 0, 0], _response("d"))
+    assert reloaded.lookup([0, 1, 0]) is None
+    assert reloaded.lookup([0, 0, 1]).reasoning == "c"
@@ -0,0 +1,41 @@
+"""Tests for node results stored in the task context."""
+
+import dataclasses
+
+import pytest
+
+from app.api.schema import EventSchema
+from app.core.schema.task import NodeResult, TaskContext
+
+
+@pytest.fixture
+def task_context() -> TaskContext:
+    return TaskContext(event=EventSchema(request="Lunch with Anna tomorrow"))
+
+
+def test_update_node_creates_the_result(task_context):
+    task_context.update_node("ClassifyEvent", response_model="classified", usage=42)
+
+    assert task_context.nodes["ClassifyEvent"] == NodeResult(response_model="classified", usage=42)
+
+
+def test_update_node_stores_an_updated_copy_and_keeps_the_original(task_context):
+    task_context.update_node("ClassifyEvent", response_model="classified", usage=42)
+    original = task_context.nodes["ClassifyEvent"]
+
+    task_context.update_node("ClassifyEvent", next_node="LookupEventExtractor")
+
+    updated = task_context.nodes["ClassifyEvent"]
+    assert updated is not original
+    assert updated == NodeResult(
+        response_model="classified", usage=42, next_node="LookupEventExtractor"
+    )
+    assert original == NodeResult(response_model="classified", usage=42)
+
+
+def test_node_result_is_immutable():
+    result = NodeResult(response_model="classified")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.usage = 42  # type: ignore
+    assert not hasattr(result, "__dict__")